@@ -0,0 +1,45 @@
+"""Per-request token verification cost: jwt.decode vs the digest-keyed cache.
+
+    python -m benchmarks.bench_auth [--iterations N]
+"""
+from datetime import datetime, timedelta
+from jose import jwt, JWTError
+from src.auth.tokens import TokenCache
+import argparse
+import time
+
+KEY = "bench-key"
+ALGORITHM = "HS256"
+
+def measure(label: str, func, iterations: int):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:>16}: {elapsed / iterations * 1e6:7.2f} us/token")
+
+def rejecting(decode):
+    def call():
+        try:
+            decode()
+        except JWTError:
+            pass
+    return call
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    token = jwt.encode({"sub": "alice", "exp": datetime.utcnow() + timedelta(minutes=30)}, KEY, ALGORITHM)
+    expired = jwt.encode({"sub": "alice", "exp": datetime.utcnow() - timedelta(minutes=1)}, KEY, ALGORITHM)
+    tokens = TokenCache()
+
+    measure("jwt.decode", lambda: jwt.decode(token, KEY, algorithms=[ALGORITHM]), args.iterations)
+    measure("cached", lambda: tokens.decode(token, KEY, ALGORITHM), args.iterations)
+    measure("expired/jose", rejecting(lambda: jwt.decode(expired, KEY, algorithms=[ALGORITHM])), args.iterations)
+    measure("expired/fast", rejecting(lambda: tokens.decode(expired, KEY, ALGORITHM)), args.iterations)
+    measure("malformed/fast", rejecting(lambda: tokens.decode("garbage", KEY, ALGORITHM)), args.iterations)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Write throughput of the SQLite engine profiles with several writer threads.
+
+    python -m benchmarks.bench_db_writes [--rows N] [--workers 1,4,8]
+"""
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from concurrent.futures import ThreadPoolExecutor
+from models import Base
+from models.user import User
+from src.database import create_db_engine
+import argparse
+import os
+import tempfile
+import time
+
+def baseline_engine(url: str):
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+def run(engine, workers: int, rows: int) -> float:
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    per_worker = rows // workers
+
+    def write(worker):
+        for i in range(per_worker):
+            with Session() as db:
+                db.add(User(username=f"{worker}-{i}", email=f"{worker}-{i}@example.com", role="user"))
+                db.commit()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(write, range(workers)))
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--workers", default="1,4,8")
+    args = parser.parse_args()
+
+    for workers in [int(n) for n in args.workers.split(",")]:
+        for name, factory in [
+            ("default", baseline_engine),
+            ("production", lambda url: create_db_engine(url, profile="production"))
+        ]:
+            with tempfile.TemporaryDirectory() as tmp:
+                engine = factory(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+                try:
+                    elapsed = run(engine, workers, args.rows)
+                    result = f"{args.rows / elapsed:>8,.0f} commits/s"
+                except Exception as exc:
+                    result = f"failed: {type(exc).__name__}: {exc}".splitlines()[0]
+                engine.dispose()
+            print(f"{workers} workers {name:>10}: {result}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Throughput of /health behind the old BaseHTTPMiddleware stack vs the ASGI pipeline.
+
+    python -m benchmarks.bench_middleware [--requests N] [--concurrency N]
+"""
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from src.auth.security import SecurityConfig
+from src.middleware import SecurityMiddleware
+import argparse
+import asyncio
+import httpx
+import time
+
+class LegacySecurityMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        for key, value in SecurityConfig.get_security_headers().items():
+            response.headers[key] = value
+        return response
+
+class LegacySessionMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        return await call_next(request)
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, requests_per_minute: int = 60):
+        super().__init__(app)
+        self.requests_per_minute = requests_per_minute
+        self.requests = {}
+
+    async def dispatch(self, request: Request, call_next):
+        client_ip = request.client.host
+        current_time = time.time()
+        self.requests = {ip: times for ip, times in self.requests.items()
+                        if current_time - times[-1] < 60}
+        times = self.requests.setdefault(client_ip, [])
+        if len(times) >= self.requests_per_minute:
+            if current_time - times[0] < 60:
+                return Response(status_code=429, content="Too many requests")
+            times.pop(0)
+        times.append(current_time)
+        return await call_next(request)
+
+def health_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    return app
+
+def legacy_app(limit: int) -> FastAPI:
+    app = health_app()
+    app.add_middleware(LegacySecurityMiddleware)
+    app.add_middleware(LegacySessionMiddleware)
+    app.add_middleware(SessionMiddleware, secret_key="bench")
+    app.add_middleware(LegacyRateLimitMiddleware, requests_per_minute=limit)
+    app.add_middleware(SessionMiddleware, secret_key="bench")
+    return app
+
+def pipeline_app(limit: int) -> FastAPI:
+    app = health_app()
+    app.add_middleware(SecurityMiddleware, requests_per_minute=limit)
+    app.add_middleware(SessionMiddleware, secret_key="bench")
+    return app
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+        await client.get("/health")
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                response = await client.get("/health")
+                assert response.status_code == 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    limit = args.requests * 2
+    for name, app in [("before", legacy_app(limit)), ("after", pipeline_app(limit))]:
+        elapsed = asyncio.run(measure(app, args.requests, args.concurrency))
+        print(f"{name:>6}: {args.requests / elapsed:>8,.0f} req/s  "
+              f"{elapsed / args.requests * 1e6:7.1f} us/req")
+
+if __name__ == "__main__":
+    main()
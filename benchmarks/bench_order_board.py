@@ -0,0 +1,64 @@
+"""Kanban board: a query and a COUNT(*) per status, ROW_NUMBER() ranking, and board_statement.
+
+    python -m benchmarks.bench_order_board [--rows N] [--repeat N]
+"""
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+from models import Base
+from models.order import Order, OrderStatus, OrderStatusCount, board_columns, board_statement
+from src.database import create_db_engine
+from benchmarks.bench_order_search import populate
+import argparse
+import os
+import tempfile
+import time
+
+def per_status(db, limit: int):
+    columns = []
+    for status in OrderStatus:
+        orders = db.execute(
+            select(Order).where(Order.status == status.value)
+            .order_by(Order.created_at.desc(), Order.id.desc()).limit(limit)
+        ).scalars().all()
+        count = db.execute(select(func.count()).where(Order.status == status.value)).scalar()
+        columns.append({"status": status.value, "count": count, "orders": orders})
+    return columns
+
+def ranked(db, limit: int):
+    position = func.row_number().over(
+        partition_by=Order.status, order_by=(Order.created_at.desc(), Order.id.desc())
+    ).label("position")
+    ranking = select(Order.id, Order.status, position).subquery()
+    top = select(ranking.c.id).where(ranking.c.position <= limit)
+    orders = db.execute(select(Order).where(Order.id.in_(top))).scalars().all()
+    counts = db.execute(select(OrderStatusCount.status, OrderStatusCount.count)).all()
+    return orders, counts
+
+def board(db, limit: int):
+    return board_columns(db.execute(board_statement(limit)))
+
+def measure(db, label: str, build, limit: int, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        build(db, limit)
+    print(f"{label:>10}: {(time.perf_counter() - started) / repeat * 1000:8.2f} ms/board")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_db_engine(f"sqlite:///{os.path.join(workdir, 'orders.db')}", profile="production")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            populate(db, args.rows)
+            measure(db, "per-status", per_status, args.limit, args.repeat)
+            measure(db, "row_number", ranked, args.limit, args.repeat)
+            measure(db, "board", board, args.limit, args.repeat)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
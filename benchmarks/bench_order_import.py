@@ -0,0 +1,69 @@
+"""Order CSV import throughput per stage, serial vs process-pool validation.
+
+    python -m benchmarks.bench_order_import [--rows N] [--workers N] [--chunk-size N]
+"""
+from sqlalchemy.orm import sessionmaker
+from models import Base
+from models.product import Product
+from src.database import create_db_engine
+from src.imports.orders import ValidationPool, import_orders
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+
+PRODUCTS = 1000
+
+def make_csv(path: str, rows: int):
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["order_number", "customer_name", "project_name", "product_list", "status", "notes"])
+        for i in range(rows):
+            items = [{"id": f"P{rng.randrange(PRODUCTS)}", "quantity": rng.randint(1, 9)}
+                     for _ in range(rng.randint(1, 8))]
+            writer.writerow([f"ORD-{i:08d}", f"Customer {i % 500}", f"Project {i % 50}",
+                             json.dumps(items), rng.choice(["new", "in_progress", "completed"]),
+                             "Deliver before noon" if i % 3 == 0 else ""])
+
+def run(name: str, csv_path: str, workdir: str, pool, chunk_size: int):
+    engine = create_db_engine(f"sqlite:///{os.path.join(workdir, name)}.db", profile="production")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.execute(Product.__table__.insert(), [
+            {"id": f"P{i}", "product_name": f"Product {i}"} for i in range(PRODUCTS)
+        ])
+        db.commit()
+        with open(csv_path, "rb") as source:
+            started = time.perf_counter()
+            report = import_orders(db, source, chunk_size=chunk_size, pool=pool)
+            elapsed = time.perf_counter() - started
+    engine.dispose()
+    print(f"{name:>8}: {report.imported / elapsed:>9,.0f} rows/s total ({elapsed:.2f} s)")
+    for stage, stats in report.stages.items():
+        print(f"{'':>10}{stage:>9}: {stats['seconds']:7.3f} s  {stats['rows_per_second']:>12,.0f} rows/s")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "orders.csv")
+        make_csv(csv_path, args.rows)
+        run("serial", csv_path, workdir, None, args.chunk_size)
+        pool = ValidationPool(args.workers)
+        pool.executor.submit(int).result()  # exclude worker start-up
+        try:
+            run("parallel", csv_path, workdir, pool, args.chunk_size)
+        finally:
+            pool.shutdown()
+
+if __name__ == "__main__":
+    main()
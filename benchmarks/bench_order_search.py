@@ -0,0 +1,79 @@
+"""Order text search: LIKE '%q%' scan vs the FTS5 trigram index.
+
+    python -m benchmarks.bench_order_search [--rows N] [--repeat N]
+"""
+from sqlalchemy import or_, select
+from sqlalchemy.orm import sessionmaker
+from models import Base
+from models.order import Order, filter_created, search_statement
+from src.database import create_db_engine
+from datetime import date, datetime
+import argparse
+import os
+import random
+import tempfile
+import time
+
+WORDS = ["alpha", "bravo", "cobalt", "delta", "ember", "falcon", "granite", "harbor", "indigo",
+         "juniper", "kestrel", "lumen", "meridian", "nimbus", "onyx", "polaris", "quartz", "raven"]
+QUERIES = ["acme", "falcon", "ridian", "quartz harbor", "zzzz"]
+
+def populate(db, rows: int):
+    rng = random.Random(0)
+    batch = []
+    for i in range(rows):
+        words = rng.sample(WORDS, 4)
+        batch.append({
+            "order_number": f"ORD-{i:08d}",
+            "customer_name": ("Acme " if i % 1000 == 0 else "") + f"{words[0].title()} {words[1].title()} Ltd",
+            "project_name": f"{words[2]} {words[3]} rollout",
+            "notes": f"call {rng.choice(WORDS)} before delivery" if i % 4 == 0 else None,
+            "product_list": [],
+            "status": rng.choice(["new", "in_progress", "completed", "cancelled"]),
+            "created_at": datetime(2024, 1 + i % 12, 1 + i % 28, 12)
+        })
+        if len(batch) == 10000:
+            db.execute(Order.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.execute(Order.__table__.insert(), batch)
+    db.commit()
+
+def like_statement(query: str, status: str, date_from: date, date_to: date):
+    pattern = f"%{query}%"
+    statement = select(Order).where(
+        or_(Order.customer_name.like(pattern), Order.project_name.like(pattern), Order.notes.like(pattern)),
+        Order.status == status
+    )
+    return filter_created(statement, date_from, date_to).order_by(Order.created_at.desc()).limit(10)
+
+def measure(db, label: str, build, repeat: int):
+    timings = []
+    for query in QUERIES:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            db.execute(build(query)).scalars().all()
+        timings.append((time.perf_counter() - started) / repeat * 1000)
+    per_query = "  ".join(f"{q!r} {ms:7.2f}" for q, ms in zip(QUERIES, timings))
+    print(f"{label:>5}: {sum(timings) / len(timings):8.2f} ms/query avg   {per_query}")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    filters = ("new", date(2024, 3, 1), date(2024, 9, 30))
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_db_engine(f"sqlite:///{os.path.join(workdir, 'orders.db')}", profile="production")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            started = time.perf_counter()
+            populate(db, args.rows)
+            print(f"{args.rows:,} orders indexed in {time.perf_counter() - started:.1f} s")
+            measure(db, "like", lambda q: like_statement(q, *filters), args.repeat)
+            measure(db, "fts5", lambda q: search_statement(q, *filters), args.repeat)
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Product CSV import: load-everything ORM loop vs the streaming batched importer.
+
+    python -m benchmarks.bench_product_import [--rows N] [--batch-size N]
+"""
+from sqlalchemy.orm import sessionmaker
+from models import Base
+from models.product import Product
+from src.database import create_db_engine
+from src.imports.products import import_products
+import argparse
+import csv
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+def make_csv(path: str, rows: int):
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "product_name"])
+        for i in range(rows):
+            writer.writerow([f"P{i:07d}", f"Product number {i} with a reasonably long descriptive name"])
+
+def naive_import(db, source):
+    text = source.read().decode("utf-8-sig")
+    seen = set()
+    for row in list(csv.DictReader(io.StringIO(text))):
+        if row["id"] in seen or db.query(Product).filter(Product.id == row["id"]).first():
+            continue
+        seen.add(row["id"])
+        db.add(Product(id=row["id"], product_name=row["product_name"]))
+    db.commit()
+
+def measure(name: str, func, csv_path: str, workdir: str, rows: int):
+    engine = create_db_engine(f"sqlite:///{os.path.join(workdir, name)}.db", profile="production")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db, open(csv_path, "rb") as source:
+        tracemalloc.start()
+        started = time.perf_counter()
+        func(db, source)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert db.query(Product).count() == rows
+    engine.dispose()
+    print(f"{name:>9}: {rows / elapsed:>9,.0f} rows/s  {elapsed:6.2f} s  peak {peak / 2**20:6.1f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--skip-naive", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "products.csv")
+        make_csv(csv_path, args.rows)
+        print(f"{args.rows:,} rows, {os.path.getsize(csv_path) / 2**20:.1f} MiB")
+        if not args.skip_naive:
+            measure("naive", naive_import, csv_path, workdir, args.rows)
+        measure("streaming", lambda db, source: import_products(db, source, args.batch_size),
+                csv_path, workdir, args.rows)
+
+if __name__ == "__main__":
+    main()
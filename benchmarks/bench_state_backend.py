@@ -0,0 +1,52 @@
+"""Compare the in-memory and SQLite rate-limit state backends.
+
+    python -m benchmarks.bench_state_backend [--hits N] [--clients N] [--workers N]
+"""
+from multiprocessing import Pool
+from src.auth.state import MemoryStateBackend, SQLiteStateBackend
+import argparse
+import os
+import tempfile
+import time
+
+def run_hits(backend, hits: int, clients: int) -> float:
+    started = time.perf_counter()
+    for i in range(hits):
+        backend.hit(f"10.0.{i % clients // 256}.{i % 256}", 60, 60)
+    return time.perf_counter() - started
+
+def worker(args):
+    path, hits, limit = args
+    backend = SQLiteStateBackend(path)
+    allowed = sum(backend.hit("shared-client", limit, 3600) for _ in range(hits))
+    backend.close()
+    return allowed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hits", type=int, default=50_000)
+    parser.add_argument("--clients", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.db")
+        for name, backend in [
+            ("memory", MemoryStateBackend()),
+            ("sqlite", SQLiteStateBackend(path))
+        ]:
+            elapsed = run_hits(backend, args.hits, args.clients)
+            print(f"{name:>7}: {args.hits / elapsed:>10,.0f} hits/s  "
+                  f"{elapsed / args.hits * 1e6:6.1f} us/hit")
+
+        limit = args.hits // 10
+        per_worker = limit // args.workers * 2
+        with Pool(args.workers) as pool:
+            started = time.perf_counter()
+            allowed = sum(pool.map(worker, [(path, per_worker, limit)] * args.workers))
+            elapsed = time.perf_counter() - started
+        print(f"{args.workers} workers x {per_worker} hits on one key, limit {limit}: "
+              f"{allowed} allowed in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from models.user import Base
+from models.product import Product
+from models.order import Order
+from models.version import TableVersion
@@ -0,0 +1,196 @@
+"""AsyncSession counterparts of the functions in models.crud.
+
+Every function here has the same name and arguments as its sync twin, so
+``run`` can dispatch a ``models.crud`` function to whichever session a route
+was given. A crud function without a twin fails the import of this module.
+"""
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from . import schemas
+from .user import User
+from .product import Product
+from .version import versions_statement
+from .order import (
+    Order, board_columns, board_statement, detail_statement, order_detail, order_number_error,
+    product_orders_statement, product_quantities_statement, search_statement
+)
+from typing import Any, Callable, Dict, Optional, List, Tuple
+from datetime import date, datetime
+import inspect
+
+async def run(db, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call the ``models.crud`` function ``func`` on ``db`` without blocking the loop.
+
+    An AsyncSession is served by the async twin of ``func``; a sync Session
+    runs ``func`` itself in the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        twin = TWINS.get(func)
+        if twin is None:
+            raise TypeError(f"{func.__qualname__} is not a models.crud function")
+        return await twin(db, *args, **kwargs)
+    return await run_in_threadpool(func, db, *args, **kwargs)
+
+async def _first(db: AsyncSession, statement) -> Optional[User]:
+    result = await db.execute(statement.limit(1))
+    return result.scalars().first()
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    return await _first(db, select(User).where(User.id == user_id))
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    return await _first(db, select(User).where(User.email == email))
+
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
+    return await _first(db, select(User).where(User.username == username))
+
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    return list(result.scalars())
+
+async def get_users_page(db: AsyncSession, keyset, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[User], Optional[str]]:
+    result = await db.execute(keyset.apply(select(User), cursor, limit))
+    return keyset.page(result.scalars().all(), limit)
+
+async def get_users_next_cursor(db: AsyncSession, keyset, cursor: Optional[str] = None, limit: int = 100) -> Optional[str]:
+    result = await db.execute(keyset.keys(select(User), cursor, limit))
+    return keyset.next_cursor(result.all(), limit)
+
+async def create_user(db: AsyncSession, user: schemas.UserCreate, hashed_password: str) -> User:
+    db_user = User(
+        username=user.username,
+        email=user.email,
+        hashed_password=hashed_password,
+        role=user.role
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+async def get_user_by_reset_token(db: AsyncSession, token: str) -> Optional[User]:
+    return await _first(db, select(User).where(User.reset_token == token))
+
+async def update_user(db: AsyncSession, user: User, changes: dict) -> User:
+    for field, value in changes.items():
+        setattr(user, field, value)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+async def set_password(db: AsyncSession, user_id: int, hashed_password: str):
+    await db.execute(
+        update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+    )
+    await db.commit()
+
+async def set_reset_token(db: AsyncSession, user_id: int, token: Optional[str], expires: Optional[datetime]):
+    await db.execute(
+        update(User).where(User.id == user_id).values(reset_token=token, reset_token_expires=expires)
+    )
+    await db.commit()
+
+async def reset_password(db: AsyncSession, user_id: int, hashed_password: str):
+    await db.execute(
+        update(User).where(User.id == user_id).values(
+            hashed_password=hashed_password,
+            reset_token=None,
+            reset_token_expires=None
+        )
+    )
+    await db.commit()
+
+async def get_products_page(db: AsyncSession, keyset, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[Product], Optional[str]]:
+    result = await db.execute(keyset.apply(select(Product), cursor, limit))
+    return keyset.page(result.scalars().all(), limit)
+
+async def get_product_search_rows(db: AsyncSession) -> List[Tuple[int, str, str]]:
+    result = await db.execute(select(Product.internal_id, Product.id, Product.product_name))
+    return result.all()
+
+async def get_orders_page(db: AsyncSession, query, cursor: Optional[str] = None, limit: int = 10) -> Tuple[List[Order], Optional[str]]:
+    result = await db.execute(query.page(cursor, limit))
+    return query.keyset.page(result.scalars().all(), limit)
+
+async def get_order(db: AsyncSession, order_id: int) -> Optional[Order]:
+    return await db.get(Order, order_id)
+
+async def get_order_detail(db: AsyncSession, order_id: int) -> Optional[dict]:
+    result = await db.execute(detail_statement(order_id))
+    return order_detail(result)
+
+async def get_order_by_number(db: AsyncSession, order_number: str) -> Optional[Order]:
+    result = await db.execute(select(Order).where(Order.order_number == order_number))
+    return result.scalars().first()
+
+async def get_unknown_products(db: AsyncSession, product_ids: List[str]) -> List[str]:
+    result = await db.execute(select(Product.id).where(Product.id.in_(product_ids)))
+    known = set(result.scalars())
+    return [p for p in dict.fromkeys(product_ids) if p not in known]
+
+async def create_order(db: AsyncSession, order: schemas.OrderCreate) -> Order:
+    db_order = Order(**order.model_dump(mode="json"))
+    db.add(db_order)
+    try:
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
+        raise order_number_error(error)
+    await db.refresh(db_order)
+    return db_order
+
+async def update_order(db: AsyncSession, order: Order, changes: dict) -> Order:
+    for field, value in changes.items():
+        setattr(order, field, value)
+    try:
+        await db.commit()
+    except IntegrityError as error:
+        await db.rollback()
+        raise order_number_error(error)
+    await db.refresh(order)
+    return order
+
+async def get_product_orders(db: AsyncSession, product_id: str, statuses: List[str], limit: int = 100) -> List[Order]:
+    result = await db.execute(product_orders_statement(product_id, statuses, limit))
+    return list(result.scalars())
+
+async def get_product_quantities(db: AsyncSession, product_ids: List[str], statuses: List[str]) -> List[Tuple[str, int, int]]:
+    result = await db.execute(product_quantities_statement(product_ids, statuses))
+    return result.all()
+
+async def get_table_versions(db: AsyncSession, names: List[str]) -> Dict[str, int]:
+    result = await db.execute(versions_statement(names))
+    return dict(result.all())
+
+async def get_order_board(db: AsyncSession, limit: int = 10) -> List[dict]:
+    result = await db.execute(board_statement(limit))
+    return board_columns(result)
+
+async def set_order_status(db: AsyncSession, order: Order, status: str) -> Order:
+    order.status = status
+    await db.commit()
+    await db.refresh(order)
+    return order
+
+async def search_orders(db: AsyncSession, query: str, status: Optional[str] = None, date_from: Optional[date] = None,
+                        date_to: Optional[date] = None, limit: int = 10) -> List[Order]:
+    result = await db.execute(search_statement(query, status, date_from, date_to, limit))
+    return list(result.scalars())
+
+def _twins() -> Dict[Callable, Callable]:
+    from . import crud
+    twins, missing = {}, []
+    for name, func in vars(crud).items():
+        if inspect.isfunction(func) and func.__module__ == crud.__name__:
+            twin = globals().get(name)
+            if inspect.iscoroutinefunction(twin):
+                twins[func] = twin
+            else:
+                missing.append(name)
+    if missing:
+        raise ImportError(f"models.async_crud has no async twin for: {', '.join(missing)}")
+    return twins
+
+TWINS = _twins()
@@ -1,8 +1,16 @@
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from . import schemas
 from .user import User, UserRole
-from src.auth.security import SecurityUtils
-from typing import Optional, List
+from .product import Product
+from .version import versions_statement
+from .order import (
+    Order, board_columns, board_statement, detail_statement, order_detail, order_number_error,
+    product_orders_statement, product_quantities_statement, search_statement
+)
+from typing import Dict, Optional, List, Tuple
+from datetime import date, datetime
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
@@ -16,8 +24,14 @@ def get_user_by_username(db: Session, username: str) -> Optional[User]:
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
     return db.query(User).offset(skip).limit(limit).all()
 
-def create_user(db: Session, user: schemas.UserCreate) -> User:
-    hashed_password = SecurityUtils.get_password_hash(user.password)
+def get_users_page(db: Session, keyset, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[User], Optional[str]]:
+    rows = db.execute(keyset.apply(select(User), cursor, limit)).scalars().all()
+    return keyset.page(rows, limit)
+
+def get_users_next_cursor(db: Session, keyset, cursor: Optional[str] = None, limit: int = 100) -> Optional[str]:
+    return keyset.next_cursor(db.execute(keyset.keys(select(User), cursor, limit)).all(), limit)
+
+def create_user(db: Session, user: schemas.UserCreate, hashed_password: str) -> User:
     db_user = User(
         username=user.username,
         email=user.email,
@@ -30,4 +44,101 @@ def create_user(db: Session, user: schemas.UserCreate) -> User:
     return db_user
 
 def get_user_by_reset_token(db: Session, token: str) -> Optional[User]:
-    return db.query(User).filter(User.reset_token == token).first()
\ No newline at end of file
+    return db.query(User).filter(User.reset_token == token).first()
+
+def update_user(db: Session, user: User, changes: dict) -> User:
+    for field, value in changes.items():
+        setattr(user, field, value)
+    db.commit()
+    db.refresh(user)
+    return user
+
+def set_password(db: Session, user_id: int, hashed_password: str):
+    db.execute(
+        update(User).where(User.id == user_id).values(hashed_password=hashed_password)
+    )
+    db.commit()
+
+def set_reset_token(db: Session, user_id: int, token: Optional[str], expires: Optional[datetime]):
+    db.execute(
+        update(User).where(User.id == user_id).values(reset_token=token, reset_token_expires=expires)
+    )
+    db.commit()
+
+def reset_password(db: Session, user_id: int, hashed_password: str):
+    db.execute(
+        update(User).where(User.id == user_id).values(
+            hashed_password=hashed_password,
+            reset_token=None,
+            reset_token_expires=None
+        )
+    )
+    db.commit()
+
+def get_products_page(db: Session, keyset, cursor: Optional[str] = None, limit: int = 100) -> Tuple[List[Product], Optional[str]]:
+    rows = db.execute(keyset.apply(select(Product), cursor, limit)).scalars().all()
+    return keyset.page(rows, limit)
+
+def get_product_search_rows(db: Session) -> List[Tuple[int, str, str]]:
+    return db.execute(select(Product.internal_id, Product.id, Product.product_name)).all()
+
+def get_orders_page(db: Session, query, cursor: Optional[str] = None, limit: int = 10) -> Tuple[List[Order], Optional[str]]:
+    rows = db.execute(query.page(cursor, limit)).scalars().all()
+    return query.keyset.page(rows, limit)
+
+def get_order(db: Session, order_id: int) -> Optional[Order]:
+    return db.get(Order, order_id)
+
+def get_order_detail(db: Session, order_id: int) -> Optional[dict]:
+    return order_detail(db.execute(detail_statement(order_id)))
+
+def get_order_by_number(db: Session, order_number: str) -> Optional[Order]:
+    return db.execute(select(Order).where(Order.order_number == order_number)).scalars().first()
+
+def get_unknown_products(db: Session, product_ids: List[str]) -> List[str]:
+    known = set(db.execute(select(Product.id).where(Product.id.in_(product_ids))).scalars())
+    return [p for p in dict.fromkeys(product_ids) if p not in known]
+
+def create_order(db: Session, order: schemas.OrderCreate) -> Order:
+    db_order = Order(**order.model_dump(mode="json"))
+    db.add(db_order)
+    try:
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        raise order_number_error(error)
+    db.refresh(db_order)
+    return db_order
+
+def update_order(db: Session, order: Order, changes: dict) -> Order:
+    for field, value in changes.items():
+        setattr(order, field, value)
+    try:
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        raise order_number_error(error)
+    db.refresh(order)
+    return order
+
+def get_product_orders(db: Session, product_id: str, statuses: List[str], limit: int = 100) -> List[Order]:
+    return db.execute(product_orders_statement(product_id, statuses, limit)).scalars().all()
+
+def get_product_quantities(db: Session, product_ids: List[str], statuses: List[str]) -> List[Tuple[str, int, int]]:
+    return db.execute(product_quantities_statement(product_ids, statuses)).all()
+
+def get_table_versions(db: Session, names: List[str]) -> Dict[str, int]:
+    return dict(db.execute(versions_statement(names)).all())
+
+def get_order_board(db: Session, limit: int = 10) -> List[dict]:
+    return board_columns(db.execute(board_statement(limit)))
+
+def set_order_status(db: Session, order: Order, status: str) -> Order:
+    order.status = status
+    db.commit()
+    db.refresh(order)
+    return order
+
+def search_orders(db: Session, query: str, status: Optional[str] = None, date_from: Optional[date] = None,
+                  date_to: Optional[date] = None, limit: int = 10) -> List[Order]:
+    return db.execute(search_statement(query, status, date_from, date_to, limit)).scalars().all()
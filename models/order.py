@@ -0,0 +1,315 @@
+from sqlalchemy import DDL, JSON, Column, Index, Integer, Select, String, column, event, func, literal_column, select, table, type_coerce, union_all
+from datetime import date, timedelta
+from enum import Enum
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from models.product import Product
+from models.types import Timestamp
+from models.user import Base
+
+class OrderStatus(str, Enum):
+    NEW = "new"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    order_number = Column(String, unique=True, nullable=False)
+    customer_name = Column(String, nullable=False)
+    project_name = Column(String, nullable=False)
+    # [{"id": <product id>, "quantity": <int>}, ...]
+    product_list = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default=OrderStatus.NEW.value)
+    delivery_link = Column(String)
+    invoice_link = Column(String)
+    notes = Column(String(500))
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # One index per list-view sort, with and without the status filter. Each
+    # leads with the equality column, then the sort key and id (the keyset),
+    # and carries created_at so the date filter is checked inside the index.
+    __table_args__ = (
+        Index("ix_orders_created", "created_at", "id"),
+        Index("ix_orders_status_created", "status", "created_at", "id"),
+        Index("ix_orders_project", "project_name", "id", "created_at"),
+        Index("ix_orders_status_project", "status", "project_name", "id", "created_at"),
+        Index("ix_orders_customer", "customer_name", "id", "created_at"),
+        Index("ix_orders_status_customer", "status", "customer_name", "id", "created_at"),
+    )
+
+ORDER_NUMBER_TAKEN = "Order number already exists"
+
+def order_number_error(error: IntegrityError) -> Exception:
+    """The 400 for a clash on the unique order_number; any other ``error`` as is.
+
+    Routes check the number first, but two concurrent requests can both
+    pass that check; the constraint catches the loser.
+    """
+    if "orders.order_number" in str(error.orig):
+        return HTTPException(status_code=400, detail=ORDER_NUMBER_TAKEN)
+    return error
+
+# Full-text index over the searchable text columns. It is an external-content
+# FTS5 table, so the text is stored once (in orders) and the index is kept in
+# sync by triggers, which also cover Core bulk inserts. The trigram tokenizer
+# matches substrings case-insensitively, the same results as LIKE '%q%'.
+ORDER_SEARCH_COLUMNS = ("customer_name", "project_name", "notes")
+orders_fts = table("orders_fts", column("rowid"), *(column(name) for name in ORDER_SEARCH_COLUMNS))
+
+_fts_columns = ", ".join(ORDER_SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{name}" for name in ORDER_SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{name}" for name in ORDER_SEARCH_COLUMNS)
+
+ORDER_SEARCH_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS orders_fts USING fts5(
+        {_fts_columns}, content='orders', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS orders_fts_insert AFTER INSERT ON orders BEGIN
+        INSERT INTO orders_fts (rowid, {_fts_columns}) VALUES (new.id, {_new_values});
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS orders_fts_delete AFTER DELETE ON orders BEGIN
+        INSERT INTO orders_fts (orders_fts, rowid, {_fts_columns}) VALUES ('delete', old.id, {_old_values});
+    END""",
+    # Only text edits reach the index; status changes and the like do not.
+    f"""CREATE TRIGGER IF NOT EXISTS orders_fts_update AFTER UPDATE OF {_fts_columns} ON orders BEGIN
+        INSERT INTO orders_fts (orders_fts, rowid, {_fts_columns}) VALUES ('delete', old.id, {_old_values});
+        INSERT INTO orders_fts (rowid, {_fts_columns}) VALUES (new.id, {_new_values});
+    END""",
+]
+
+for statement in ORDER_SEARCH_DDL:
+    event.listen(Order.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Order.__table__, "before_drop", DDL("DROP TABLE IF EXISTS orders_fts").execute_if(dialect="sqlite"))
+
+class OrderStatusCount(Base):
+    """Number of orders per status, kept by triggers on orders.
+
+    The triggers run inside the statement that inserts, deletes or moves an
+    order, so the totals commit or roll back with it (Core bulk inserts
+    included) and the Kanban board never needs a COUNT(*) over orders.
+    """
+    __tablename__ = "order_status_counts"
+
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+def _count(status: str, delta: int) -> str:
+    return (
+        f"INSERT INTO order_status_counts (status, count) VALUES ({status}, {delta}) "
+        f"ON CONFLICT (status) DO UPDATE SET count = count + {delta};"
+    )
+
+ORDER_STATUS_COUNT_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS orders_count_insert AFTER INSERT ON orders BEGIN
+        {_count("new.status", 1)}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS orders_count_delete AFTER DELETE ON orders BEGIN
+        {_count("old.status", -1)}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS orders_count_status AFTER UPDATE OF status ON orders
+        WHEN old.status IS NOT new.status BEGIN
+        {_count("old.status", -1)}
+        {_count("new.status", 1)}
+    END""",
+]
+
+for statement in ORDER_STATUS_COUNT_DDL:
+    event.listen(Order.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+def rebuild_status_counts(connection):
+    """Recount orders per status, e.g. for a database created before the triggers."""
+    connection.execute(OrderStatusCount.__table__.delete())
+    connection.execute(OrderStatusCount.__table__.insert().from_select(
+        ["status", "count"], select(Order.status, func.count()).group_by(Order.status)
+    ))
+
+def board_statement(limit: int) -> Select:
+    """Every status count with up to ``limit`` newest orders of that status.
+
+    Yields ``(status, count, order)`` rows, ``order`` being None for a status
+    with no cards. The cards of each status are one ``LIMIT`` seek on
+    ix_orders_status_created, so the board costs the same however many orders
+    a column holds; the seeks are combined with UNION ALL into one statement.
+    """
+    newest = [
+        select(Order.id, Order.status).where(Order.status == status.value)
+        .order_by(Order.created_at.desc(), Order.id.desc()).limit(limit).subquery()
+        for status in OrderStatus
+    ]
+    top = union_all(*(select(seek) for seek in newest)).subquery("top")
+    return (
+        select(OrderStatusCount.status, OrderStatusCount.count, Order)
+        .outerjoin(top, top.c.status == OrderStatusCount.status)
+        .outerjoin(Order, Order.id == top.c.id)
+        .order_by(OrderStatusCount.status, Order.created_at.desc(), Order.id.desc())
+    )
+
+def board_columns(rows: Iterable) -> List[Dict[str, Any]]:
+    """Group ``board_statement`` rows into columns, in workflow order."""
+    columns = {s.value: {"status": s.value, "count": 0, "orders": []} for s in OrderStatus}
+    for status, count, order in rows:
+        column = columns.setdefault(status, {"status": status, "count": 0, "orders": []})
+        column["count"] = count
+        if order is not None:
+            column["orders"].append(order)
+    return list(columns.values())
+
+class OrderItem(Base):
+    """One line of an order's ``product_list``, for index-backed product lookups.
+
+    ``product_list`` stays the source of truth. Triggers expand it with
+    json_each on every insert (ORM or Core import) and product_list update,
+    in the same statement, so the rows can never drift from the JSON.
+    """
+    __tablename__ = "order_items"
+
+    order_id = Column(Integer, primary_key=True)
+    # Position in product_list, so a repeated product id stays two lines.
+    line = Column(Integer, primary_key=True)
+    product_id = Column(String, nullable=False)
+    quantity = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_order_items_product", "product_id", "order_id", "quantity"),
+    )
+
+_expand_items = """INSERT INTO order_items (order_id, line, product_id, quantity)
+        SELECT new.id, key, json_extract(value, '$.id'), json_extract(value, '$.quantity')
+        FROM json_each(new.product_list);"""
+
+ORDER_ITEMS_DDL = [
+    f"""CREATE TRIGGER IF NOT EXISTS orders_items_insert AFTER INSERT ON orders BEGIN
+        {_expand_items}
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS orders_items_delete AFTER DELETE ON orders BEGIN
+        DELETE FROM order_items WHERE order_id = old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS orders_items_update AFTER UPDATE OF product_list ON orders BEGIN
+        DELETE FROM order_items WHERE order_id = old.id;
+        {_expand_items}
+    END""",
+]
+
+for statement in ORDER_ITEMS_DDL:
+    event.listen(Order.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+def rebuild_order_items(connection):
+    """Re-expand every product_list, e.g. for orders written before the triggers."""
+    connection.exec_driver_sql("DELETE FROM order_items")
+    connection.exec_driver_sql(
+        "INSERT INTO order_items (order_id, line, product_id, quantity) "
+        "SELECT orders.id, key, json_extract(value, '$.id'), json_extract(value, '$.quantity') "
+        "FROM orders, json_each(orders.product_list)"
+    )
+
+def detail_statement(order_id: int) -> Select:
+    """The order with each of its lines and product names, one row per line.
+
+    ``(order, product_id, product_name, quantity)``; an order without lines
+    still yields one row with the line columns None.
+    """
+    return (
+        select(Order, OrderItem.product_id, Product.product_name, OrderItem.quantity)
+        .outerjoin(OrderItem, OrderItem.order_id == Order.id)
+        .outerjoin(Product, Product.id == OrderItem.product_id)
+        .where(Order.id == order_id)
+        .order_by(OrderItem.line)
+    )
+
+def order_detail(rows: Iterable) -> Optional[Dict[str, Any]]:
+    """Fold ``detail_statement`` rows into ``{"order": ..., "items": [...]}``."""
+    detail = None
+    for order, product_id, product_name, quantity in rows:
+        if detail is None:
+            detail = {"order": order, "items": []}
+        if product_id is not None:
+            detail["items"].append({"product_id": product_id, "product_name": product_name, "quantity": quantity})
+    return detail
+
+def product_orders_statement(product_id: str, statuses: Sequence[str] = (), limit: int = 100) -> Select:
+    """Orders containing ``product_id``, newest first, found through ix_order_items_product."""
+    statement = select(Order).where(
+        Order.id.in_(select(OrderItem.order_id).where(OrderItem.product_id == product_id))
+    )
+    if statuses:
+        # Checked per row: the product's lines are the selective side.
+        statement = statement.where(Unindexed(Order.status).in_(statuses))
+    return statement.order_by(Order.id.desc()).limit(limit)
+
+def product_quantities_statement(product_ids: Sequence[str], statuses: Sequence[str] = ()) -> Select:
+    """Total ordered quantity and order count per product."""
+    statement = (
+        select(OrderItem.product_id, func.sum(OrderItem.quantity), func.count(OrderItem.order_id.distinct()))
+        .where(OrderItem.product_id.in_(product_ids))
+        .group_by(OrderItem.product_id)
+    )
+    if statuses:
+        statement = statement.join(Order, Order.id == OrderItem.order_id).where(Order.status.in_(statuses))
+    return statement
+
+def rebuild_order_search(connection):
+    """Re-index every order, e.g. after enabling search on an existing database."""
+    connection.exec_driver_sql("INSERT INTO orders_fts (orders_fts) VALUES ('rebuild')")
+
+def search_statement(
+    query: str,
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = 10
+) -> Select:
+    """Orders matching ``query`` and the filters, best bm25 match first."""
+    phrase = '"' + query.replace('"', '""') + '"'
+    statement = (
+        select(Order)
+        .join(orders_fts, orders_fts.c.rowid == Order.id)
+        .where(literal_column("orders_fts").match(phrase))
+    )
+    if status is not None:
+        statement = statement.where(Order.status == status)
+    return filter_created(statement, date_from, date_to).order_by(
+        func.bm25(literal_column("orders_fts"))
+    ).limit(limit)
+
+class Unindexed(ColumnElement):
+    """Renders ``+expr``: same value, but SQLite will not drive an index from it.
+
+    Used to keep the planner on the index that matches the ORDER BY when a
+    range filter on another column would otherwise look more selective.
+    """
+    inherit_cache = True
+    _traverse_internals = [("element", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, element):
+        self.element = element
+        self.type = element.type
+
+@compiles(Unindexed)
+def _compile_unindexed(element, compiler, **kw):
+    return "+" + compiler.process(element.element, **kw)
+
+def filter_created(
+    statement: Select,
+    date_from: Optional[date],
+    date_to: Optional[date],
+    use_index: bool = True
+) -> Select:
+    """Restrict to orders created between two dates, both inclusive."""
+    # created_at is stored as 'YYYY-MM-DD HH:MM:SS' text; comparing it to an
+    # ISO date string is exact at day boundaries and can still use an index.
+    created = type_coerce(Order.created_at, String)
+    if not use_index:
+        created = Unindexed(created)
+    if date_from is not None:
+        statement = statement.where(created >= date_from.isoformat())
+    if date_to is not None:
+        statement = statement.where(created < (date_to + timedelta(days=1)).isoformat())
+    return statement
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, func
+from models.types import Timestamp
+from models.user import Base
+
+class Product(Base):
+    __tablename__ = "products"
+
+    internal_id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(String, unique=True, nullable=False)
+    product_name = Column(String(500), nullable=False)
+    # Server-side defaults keep bulk inserts to plain parameter tuples.
+    created_at = Column(Timestamp, server_default=func.now(), nullable=False)
+    updated_at = Column(Timestamp, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from typing import Dict, List, Optional
 from datetime import datetime
 from models.user import UserRole
+from models.order import OrderStatus
 
 class UserBase(BaseModel):
     username: str
@@ -48,4 +49,98 @@ class PasswordChange(BaseModel):
 
 class Token(BaseModel):
     access_token: str
-    token_type: str
\ No newline at end of file
+    token_type: str
+
+class ProductBase(BaseModel):
+    id: str
+    product_name: str
+
+class ProductMatch(ProductBase):
+    internal_id: int
+
+class Product(ProductBase):
+    internal_id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class OrderProduct(BaseModel):
+    id: str
+    quantity: int = Field(..., gt=0)
+
+class Order(BaseModel):
+    id: int
+    order_number: str
+    customer_name: str
+    project_name: str
+    product_list: List[OrderProduct]
+    status: str
+    delivery_link: Optional[str] = None
+    invoice_link: Optional[str] = None
+    notes: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+class OrderCreate(BaseModel):
+    order_number: str = Field(..., min_length=1)
+    customer_name: str = Field(..., min_length=1)
+    project_name: str = Field(..., min_length=1)
+    product_list: List[OrderProduct] = Field(..., min_length=1)
+    status: OrderStatus = OrderStatus.NEW
+    delivery_link: Optional[str] = None
+    invoice_link: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=500)
+
+class OrderUpdate(BaseModel):
+    order_number: Optional[str] = Field(None, min_length=1)
+    customer_name: Optional[str] = Field(None, min_length=1)
+    project_name: Optional[str] = Field(None, min_length=1)
+    product_list: Optional[List[OrderProduct]] = Field(None, min_length=1)
+    status: Optional[OrderStatus] = None
+    delivery_link: Optional[str] = None
+    invoice_link: Optional[str] = None
+    notes: Optional[str] = Field(None, max_length=500)
+
+class OrderLine(BaseModel):
+    product_id: str
+    product_name: Optional[str] = None
+    quantity: int
+
+class OrderDetail(BaseModel):
+    order: Order
+    items: List[OrderLine]
+
+class ProductOrderTotal(BaseModel):
+    product_id: str
+    quantity: int
+    orders: int
+
+class OrderStatusUpdate(BaseModel):
+    status: OrderStatus
+
+class BoardColumn(BaseModel):
+    status: str
+    count: int
+    orders: List[Order]
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+class ImportStage(BaseModel):
+    seconds: float
+    rows_per_second: float
+
+class ImportReport(BaseModel):
+    processed: int
+    imported: int
+    failed: int
+    rolled_back: int = 0
+    errors: List[ImportRowError]
+    errors_truncated: bool
+    stages: Dict[str, ImportStage] = {}
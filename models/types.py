@@ -0,0 +1,10 @@
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
+
+# SQLite has no datetime type; values are compared as text. Storing bound
+# datetimes in the same 'YYYY-MM-DD HH:MM:SS' form as CURRENT_TIMESTAMP keeps
+# server-filled and Python-filled values (and keyset cursors) comparable.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite"
+)
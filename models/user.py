@@ -1,10 +1,9 @@
 from sqlalchemy import Column, Integer, String, Boolean
 from sqlalchemy.ext.declarative import declarative_base
-from passlib.context import CryptContext
 from enum import Enum
+from src.auth.hashing import pwd_context, password_hasher
 
 Base = declarative_base()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 class UserRole(str, Enum):
     ADMIN = "admin"
@@ -18,6 +17,7 @@ class UserPermission(str, Enum):
     VIEW_ORDERS = "view_orders"
     MANAGE_ORDERS = "manage_orders"
     MANAGE_USERS = "manage_users"
+    IMPORT_EXPORT = "import_export"
 
 ROLE_PERMISSIONS = {
     UserRole.ADMIN: [perm.value for perm in UserPermission],
@@ -25,7 +25,8 @@ ROLE_PERMISSIONS = {
         UserPermission.CREATE_PRODUCT,
         UserPermission.EDIT_PRODUCT,
         UserPermission.VIEW_ORDERS,
-        UserPermission.MANAGE_ORDERS
+        UserPermission.MANAGE_ORDERS,
+        UserPermission.IMPORT_EXPORT
     ],
     UserRole.USER: [
         UserPermission.VIEW_ORDERS
@@ -47,4 +48,11 @@ class User(Base):
 
     @staticmethod
     def get_password_hash(password):
-        return pwd_context.hash(password)
\ No newline at end of file
+        return pwd_context.hash(password)
+
+    async def verify_password_async(self, plain_password):
+        return await password_hasher.verify(plain_password, self.hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password):
+        return await password_hasher.hash(password)
@@ -0,0 +1,37 @@
+from sqlalchemy import DDL, Column, Integer, Select, String, event, select
+from typing import Sequence
+from models.order import Order
+from models.product import Product
+from models.user import Base
+
+class TableVersion(Base):
+    """A counter per table, bumped by triggers on every row written.
+
+    The bump runs inside the writing statement, so a rolled back write never
+    changes the version and a committed one always does, whichever code path
+    (ORM, Core bulk import) made it. Readers compare versions to tell whether
+    anything changed without querying the table itself.
+    """
+    __tablename__ = "table_versions"
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+VERSIONED_TABLES = (Order.__table__, Product.__table__)
+
+def _bump(table: str) -> str:
+    return (
+        f"INSERT INTO table_versions (name, version) VALUES ('{table}', 1) "
+        f"ON CONFLICT (name) DO UPDATE SET version = version + 1;"
+    )
+
+for versioned in VERSIONED_TABLES:
+    for operation in ("INSERT", "UPDATE", "DELETE"):
+        trigger = f"""CREATE TRIGGER IF NOT EXISTS {versioned.name}_version_{operation.lower()}
+            AFTER {operation} ON {versioned.name} BEGIN
+            {_bump(versioned.name)}
+        END"""
+        event.listen(versioned, "after_create", DDL(trigger).execute_if(dialect="sqlite"))
+
+def versions_statement(names: Sequence[str]) -> Select:
+    return select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(names))
@@ -0,0 +1,173 @@
+"""Static asset build: fingerprinted copies, precompressed variants and a manifest.
+
+    python -m src.assets [--source app/static] [--target app/build/static]
+"""
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import anyio
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+import stat
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = Path(__file__).parent.parent
+
+class AssetConfig:
+    SOURCE_DIR = BASE_DIR / "app" / "static"
+    BUILD_DIR = Path(os.getenv("STATIC_BUILD_DIR", str(BASE_DIR / "app" / "build" / "static")))
+    MANIFEST = "manifest.json"
+    HASH_LENGTH = 12
+    # Smaller files gain nothing from compression once headers are counted.
+    COMPRESS_MIN_BYTES = 256
+    COMPRESSIBLE = frozenset({".css", ".js", ".mjs", ".map", ".json", ".svg", ".html", ".txt", ".xml", ".ico"})
+    IMMUTABLE = "public, max-age=31536000, immutable"
+    REVALIDATE = "no-cache"
+
+# Variants in order of preference, with the file suffix they are stored under.
+ENCODINGS: List[Tuple[str, str]] = [("br", ".br"), ("gzip", ".gz")] if brotli else [("gzip", ".gz")]
+
+def fingerprint(path: str, data: bytes) -> str:
+    """``css/site.css`` -> ``css/site.<hash>.css``, the hash covering the content."""
+    digest = hashlib.sha256(data).hexdigest()[:AssetConfig.HASH_LENGTH]
+    stem, suffix = os.path.splitext(path)
+    return f"{stem}.{digest}{suffix}"
+
+def _sources(source: Path) -> Iterator[str]:
+    for root, dirs, files in os.walk(source):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            if not name.startswith("."):
+                yield Path(root, name).relative_to(source).as_posix()
+
+def _compressed(data: bytes) -> Dict[str, bytes]:
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return {suffix: body for suffix, body in variants.items() if len(body) < len(data)}
+
+def build_assets(source: Path = AssetConfig.SOURCE_DIR, target: Path = AssetConfig.BUILD_DIR) -> Dict[str, str]:
+    """Write every file of ``source`` into ``target`` under its fingerprinted name.
+
+    Text assets also get ``.gz`` (and, with the ``brotli`` package, ``.br``)
+    siblings. The manifest maps each source path to its built path.
+    """
+    if target.exists():
+        shutil.rmtree(target)
+    manifest = {}
+    for path in _sources(source):
+        data = (source / path).read_bytes()
+        built = fingerprint(path, data)
+        destination = target / built
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(data)
+        if Path(path).suffix.lower() in AssetConfig.COMPRESSIBLE and len(data) >= AssetConfig.COMPRESS_MIN_BYTES:
+            for suffix, body in _compressed(data).items():
+                Path(f"{destination}{suffix}").write_bytes(body)
+        manifest[path] = built
+    target.mkdir(parents=True, exist_ok=True)
+    (target / AssetConfig.MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+class AssetManifest:
+    """Resolves source asset paths to the URLs of their fingerprinted builds."""
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None, prefix: str = "/static"):
+        self.entries = entries or {}
+        self.built = frozenset(self.entries.values())
+        self.prefix = prefix
+
+    @classmethod
+    def load(cls, directory: Path, prefix: str = "/static") -> "AssetManifest":
+        path = directory / AssetConfig.MANIFEST
+        if not path.is_file():
+            return cls(prefix=prefix)
+        return cls(json.loads(path.read_text()), prefix)
+
+    def url(self, path: str) -> str:
+        path = path.lstrip("/")
+        return f"{self.prefix}/{self.entries.get(path, path)}"
+
+def static_directory(manifest: AssetManifest) -> Path:
+    """The build when there is one, else the sources as they are (development)."""
+    return AssetConfig.BUILD_DIR if manifest.entries else AssetConfig.SOURCE_DIR
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    encodings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a built ``.br``/``.gz`` sibling when the client accepts it.
+
+    Fingerprinted files never change under their name, so they are sent
+    with an immutable one-year Cache-Control; anything else (a development
+    tree without a build) must be revalidated.
+    """
+
+    def __init__(self, *, directory: Path, manifest: AssetManifest, **kwargs):
+        super().__init__(directory=str(directory), **kwargs)
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._precompressed(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            immutable = path.replace(os.sep, "/") in self.manifest.built
+            response.headers["cache-control"] = AssetConfig.IMMUTABLE if immutable else AssetConfig.REVALIDATE
+            if Path(path).suffix.lower() in AssetConfig.COMPRESSIBLE:
+                response.headers["vary"] = "Accept-Encoding"
+        return response
+
+    async def _precompressed(self, path: str, scope: Scope) -> Optional[Response]:
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        for encoding, suffix in ENCODINGS:
+            if accepted.get(encoding, accepted.get("*", 0.0)) <= 0:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            response = FileResponse(full_path, stat_result=stat_result, media_type=media_type)
+            response.headers["content-encoding"] = encoding
+            if self.is_not_modified(response.headers, Headers(scope=scope)):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress static assets.")
+    parser.add_argument("--source", type=Path, default=AssetConfig.SOURCE_DIR)
+    parser.add_argument("--target", type=Path, default=AssetConfig.BUILD_DIR)
+    args = parser.parse_args()
+    manifest = build_assets(args.source, args.target)
+    print(f"{len(manifest)} assets built into {args.target}")
+
+if __name__ == "__main__":
+    main()
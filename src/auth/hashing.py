@@ -0,0 +1,107 @@
+from fastapi import HTTPException
+from concurrent.futures import ThreadPoolExecutor
+from passlib.context import CryptContext
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import os
+import time
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+class HashingConfig:
+    POOL_SIZE = int(os.getenv("HASHING_POOL_SIZE", "2"))
+    MAX_QUEUE = int(os.getenv("HASHING_MAX_QUEUE", "32"))
+    RETRY_AFTER_SECONDS = 1
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated thread pool so it never blocks the event loop.
+
+    At most ``pool_size`` hashes run at once and at most ``max_queue`` more may
+    wait for a thread; anything beyond that is rejected with a 503.
+    """
+
+    def __init__(
+        self,
+        context: CryptContext,
+        pool_size: int = HashingConfig.POOL_SIZE,
+        max_queue: int = HashingConfig.MAX_QUEUE
+    ):
+        self.context = context
+        self.pool_size = pool_size
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size,
+                thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.pool_size, 0)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.pool_size + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please try again shortly",
+                headers={"Retry-After": str(HashingConfig.RETRY_AFTER_SECONDS)}
+            )
+
+        submitted = time.perf_counter()
+        started = submitted
+
+        def call():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args)
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, call)
+        finally:
+            latency = time.perf_counter() - submitted
+            self.in_flight -= 1
+            self.completed += 1
+            self.total_wait += started - submitted
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def stats(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "pool_size": self.pool_size,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self.total_wait / completed * 1000, 2),
+            "avg_latency_ms": round(self.total_latency / completed * 1000, 2),
+            "max_latency_ms": round(self.max_latency * 1000, 2)
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+password_hasher = PasswordHasher(pwd_context)
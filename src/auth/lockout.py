@@ -0,0 +1,93 @@
+from collections import OrderedDict, deque
+from datetime import timedelta
+from typing import Callable, Deque, Optional
+from src.auth.state import MemoryStateBackend, StateBackend
+import time
+
+class LockoutTracker:
+    """In-process lockout bookkeeping with a fixed memory ceiling.
+
+    Only the last ``max_attempts`` failure times are kept per username, so the
+    lock check is a single comparison. At most ``max_keys`` usernames are
+    tracked; the least recently failing one is evicted first, and usernames
+    whose newest failure has aged out are expired a few at a time on each call.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        lockout_duration: timedelta,
+        max_keys: int = 10000,
+        expire_batch: int = 8,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        self.max_attempts = max_attempts
+        self.lockout_seconds = lockout_duration.total_seconds()
+        self.max_keys = max_keys
+        self.expire_batch = expire_batch
+        self.timer = timer
+        self.attempts: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self.evictions = 0
+
+    def record_failure(self, username: str):
+        now = self.timer()
+        window = self.attempts.get(username)
+        if window is None:
+            window = self.attempts[username] = deque(maxlen=self.max_attempts)
+        else:
+            self.attempts.move_to_end(username)
+        window.append(now)
+        while len(self.attempts) > self.max_keys:
+            self.attempts.popitem(last=False)
+            self.evictions += 1
+        self.expire(now)
+
+    def is_locked(self, username: str) -> bool:
+        now = self.timer()
+        self.expire(now)
+        window = self.attempts.get(username)
+        if window is None or len(window) < self.max_attempts:
+            return False
+        return now - window[0] < self.lockout_seconds
+
+    def reset(self, username: str):
+        self.attempts.pop(username, None)
+
+    def expire(self, now: float):
+        # Entries are ordered by their newest failure, oldest first.
+        for _ in range(self.expire_batch):
+            if not self.attempts:
+                return
+            username, window = next(iter(self.attempts.items()))
+            if now - window[-1] < self.lockout_seconds:
+                return
+            del self.attempts[username]
+
+    def __len__(self) -> int:
+        return len(self.attempts)
+
+class SharedLockoutTracker:
+    """Lockouts counted in a shared StateBackend so every worker sees them."""
+
+    def __init__(self, state: StateBackend, max_attempts: int, lockout_duration: timedelta):
+        self.state = state
+        self.max_attempts = max_attempts
+        self.lockout_seconds = lockout_duration.total_seconds()
+
+    def record_failure(self, username: str):
+        self.state.add(f"lockout:{username}", self.lockout_seconds)
+
+    def is_locked(self, username: str) -> bool:
+        return self.state.count(f"lockout:{username}", self.lockout_seconds) >= self.max_attempts
+
+    def reset(self, username: str):
+        self.state.reset(f"lockout:{username}", self.lockout_seconds)
+
+def create_lockout_tracker(
+    state: Optional[StateBackend],
+    max_attempts: int,
+    lockout_duration: timedelta
+):
+    if state is None or isinstance(state, MemoryStateBackend):
+        return LockoutTracker(max_attempts, lockout_duration)
+    return SharedLockoutTracker(state, max_attempts, lockout_duration)
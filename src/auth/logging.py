@@ -1,61 +1,207 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Any, List, Optional
+from src.auth.state import StateBackend
+from src.auth.lockout import create_lockout_tracker
+import atexit
 import logging
 import json
+import os
+import queue
+import threading
+import time
+
+class LogConfig:
+    AUTH_LOG_FILE = os.getenv("AUTH_LOG_FILE", "auth.log")
+    SECURITY_LOG_FILE = os.getenv("SECURITY_LOG_FILE", "security.log")
+    QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    BATCH_SIZE = 200
+    FLUSH_INTERVAL = 1.0
+    MAX_BYTES = 10 * 1024 * 1024
+    BACKUP_COUNT = 5
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name
+        }
+        if isinstance(record.msg, dict):
+            entry.update(record.msg)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that writes a whole batch with one write/flush."""
+
+    def __init__(self, filename: str, max_bytes: int = LogConfig.MAX_BYTES,
+                 backup_count: int = LogConfig.BACKUP_COUNT):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding="utf-8", delay=True)
+        self.setFormatter(JsonLinesFormatter())
+
+    def emit_batch(self, records: List[logging.LogRecord]):
+        data = "".join(self.format(record) + "\n" for record in records)
+        with self.lock:
+            if self.stream is None:
+                self.stream = self._open()
+            position = self.stream.tell()
+            if self.maxBytes and position and position + len(data) > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(data)
+            self.stream.flush()
+
+class LogPipeline:
+    """Bounded queue drained by a writer thread in size- or time-based batches.
+
+    Callers only enqueue the LogRecord; formatting and file I/O happen on the
+    writer thread. When the queue is full the record is dropped and counted
+    rather than blocking the request.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        handler: BatchRotatingFileHandler,
+        queue_size: int = LogConfig.QUEUE_SIZE,
+        batch_size: int = LogConfig.BATCH_SIZE,
+        flush_interval: float = LogConfig.FLUSH_INTERVAL
+    ):
+        self.handler = handler
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-pipeline", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            # Blocking put so the stop marker is not lost on a full queue.
+            self.queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        self.handler.close()
+
+    def _run(self):
+        running = True
+        while running:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    record = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if record is self._STOP:
+                    running = False
+                    break
+                batch.append(record)
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[logging.LogRecord]):
+        try:
+            self.handler.emit_batch(batch)
+        except Exception:
+            self.dropped += len(batch)
+            return
+        self.written += len(batch)
+        self.batches += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches
+        }
+
+class PipelineHandler(logging.Handler):
+    def __init__(self, pipeline: LogPipeline):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def emit(self, record: logging.LogRecord):
+        self.pipeline.enqueue(record)
+
+_pipelines: Dict[str, LogPipeline] = {}
+_pipelines_lock = threading.Lock()
+
+def get_pipeline_logger(name: str, filename: str) -> logging.Logger:
+    """Return a logger whose records go through the batching pipeline for ``filename``."""
+    with _pipelines_lock:
+        pipeline = _pipelines.get(name)
+        if pipeline is None:
+            pipeline = _pipelines[name] = LogPipeline(BatchRotatingFileHandler(filename))
+            pipeline.start()
+            logger = logging.getLogger(name)
+            logger.addHandler(PipelineHandler(pipeline))
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+    return logging.getLogger(name)
+
+def logging_stats() -> Dict[str, Any]:
+    return {name: pipeline.stats() for name, pipeline in _pipelines.items()}
+
+@atexit.register
+def shutdown_log_pipelines():
+    with _pipelines_lock:
+        for pipeline in _pipelines.values():
+            pipeline.stop()
 
 class AuthLogger:
-    def __init__(self):
-        self.failed_attempts: Dict[str, List[datetime]] = {}
+    def __init__(self, state: Optional[StateBackend] = None):
         self.lockout_duration = timedelta(minutes=15)
         self.max_attempts = 5
-        
-        # Configure logging
-        logging.basicConfig(
-            filename='auth.log',
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            level=logging.INFO
-        )
-        self.logger = logging.getLogger('auth')
-    
+        self.lockouts = create_lockout_tracker(state, self.max_attempts, self.lockout_duration)
+        self.logger = get_pipeline_logger('auth', LogConfig.AUTH_LOG_FILE)
+
     def log_failed_attempt(self, username: str, ip_address: str):
-        current_time = datetime.utcnow()
-        
-        if username not in self.failed_attempts:
-            self.failed_attempts[username] = []
-            
-        self.failed_attempts[username].append(current_time)
-        logging.warning(f"Failed login attempt for user {username} from IP {ip_address}")
-        
+        self.lockouts.record_failure(username)
+        self.logger.warning({
+            "event": "failed_login",
+            "username": username,
+            "ip_address": ip_address
+        })
+
     def is_account_locked(self, username: str) -> bool:
-        if username not in self.failed_attempts:
-            return False
-            
-        recent_attempts = [
-            attempt for attempt in self.failed_attempts[username]
-            if datetime.utcnow() - attempt < self.lockout_duration
-        ]
-        
-        return len(recent_attempts) >= self.max_attempts
+        return self.lockouts.is_locked(username)
 
 class SecurityLogger:
     def __init__(self):
-        logging.basicConfig(
-            filename='security.log',
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            level=logging.INFO
-        )
-        self.logger = logging.getLogger('security')
+        self.logger = get_pipeline_logger('security', LogConfig.SECURITY_LOG_FILE)
 
     def log_security_event(self, event_type: str, details: Dict[str, Any], severity: str = "INFO"):
-        event = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "type": event_type,
-            "severity": severity,
-            "details": details
-        }
         self.logger.log(
             logging.INFO if severity == "INFO" else logging.WARNING,
-            json.dumps(event)
+            {
+                "type": event_type,
+                "severity": severity,
+                "details": details
+            }
         )
 
     def log_auth_attempt(self, username: str, success: bool, ip_address: str):
@@ -67,4 +213,4 @@ class SecurityLogger:
                 "ip_address": ip_address
             },
             "INFO" if success else "WARNING"
-        )
\ No newline at end of file
+        )
@@ -1,30 +1,27 @@
 from fastapi import HTTPException
-from datetime import datetime, timedelta
-from typing import Dict, List
-import time
+from typing import Optional
+from src.auth.state import MemoryStateBackend, SlidingWindowCounter, StateBackend
 
 class RateLimiter:
-    def __init__(self, requests_per_minute: int = 60):
-        self.requests: Dict[str, List[datetime]] = {}
+    def __init__(self, requests_per_minute: int = 60, backend: Optional[StateBackend] = None):
         self.rate_limit = requests_per_minute
-        self.window = timedelta(minutes=1)
-        
+        self.window = 60
+        self.backend = backend or MemoryStateBackend()
+
+    @staticmethod
+    def key(client_id: str) -> str:
+        return f"rate:{client_id}"
+
+    def allow(self, client_id: str) -> bool:
+        return self.backend.hit(self.key(client_id), self.rate_limit, self.window)
+
+    def reset(self, client_id: str):
+        self.backend.reset(self.key(client_id), self.window)
+
     def check_rate_limit(self, client_id: str) -> bool:
-        now = datetime.now()
-        if client_id not in self.requests:
-            self.requests[client_id] = []
-            
-        # Clean old requests
-        self.requests[client_id] = [
-            req_time for req_time in self.requests[client_id]
-            if now - req_time < self.window
-        ]
-        
-        if len(self.requests[client_id]) >= self.rate_limit:
+        if not self.allow(client_id):
             raise HTTPException(
                 status_code=429,
                 detail="Rate limit exceeded. Please try again later."
             )
-            
-        self.requests[client_id].append(now)
-        return True
\ No newline at end of file
+        return True
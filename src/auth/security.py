@@ -2,21 +2,48 @@ from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, OAuth2PasswordBearer
 from typing import Optional, Dict
 import hashlib
+import os
 import secrets
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
 from functools import wraps
 from models.user import UserPermission, User, UserRole, ROLE_PERMISSIONS
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
-from models import crud
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from models import crud, async_crud
 from src.database import get_db
+from starlette.concurrency import run_in_threadpool
+from src.auth.hashing import pwd_context, password_hasher
+from src.auth.tokens import TokenCache, TokenConfig
+from src.cache import TTLCache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+def get_cached_user(username: str, db: Session) -> Optional[User]:
+    snapshot = user_cache.get(username)
+    if snapshot is None:
+        return None
+    # Rebuild the row from the cached columns and attach it to this
+    # request's session without emitting a SELECT.
+    cached_user = User(**snapshot)
+    make_transient_to_detached(cached_user)
+    return db.merge(cached_user, load=False)
+
+def load_user(username: str, db: Session) -> Optional[User]:
+    user = crud.get_user_by_username(db, username)
+    if user is not None:
+        user_cache.set(username, {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        })
+    return user
+
 def get_user(username: str, db: Session = Depends(get_db)) -> Optional[User]:
-    return crud.get_user_by_username(db, username)
+    return get_cached_user(username, db) or load_user(username, db)
+
+def invalidate_cached_user(*usernames: str):
+    for username in usernames:
+        user_cache.pop(username)
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -28,23 +55,25 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SecurityConfig.SECRET_KEY, algorithms=[SecurityConfig.ALGORITHM])
+        payload = token_cache.decode(token, SecurityConfig.SECRET_KEY, SecurityConfig.ALGORITHM)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = get_user(username, db)
+    user = get_cached_user(username, db)
+    if user is None:
+        user = await run_in_threadpool(load_user, username, db)
     if user is None:
         raise credentials_exception
     return user
 
 async def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
-    user = crud.get_user_by_username(db, username)
+    user = await async_crud.run(db, crud.get_user_by_username, username)
     if not user:
         return None
-    if not SecurityUtils.verify_password(password, user.hashed_password):
+    if not await SecurityUtils.verify_password_async(password, user.hashed_password):
         return None
     return user
 
@@ -75,7 +104,9 @@ class SecurityHeaders:
         }
 
 class SecurityConfig:
-    SECRET_KEY = secrets.token_urlsafe(32)
+    # Must be set, and the same, for every worker: tokens and cursors signed
+    # by one are checked by the others. Unset, each process picks its own.
+    SECRET_KEY = os.getenv("SECRET_KEY") or secrets.token_urlsafe(32)
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 30
     
@@ -91,10 +122,26 @@ class SecurityConfig:
         "Referrer-Policy": "strict-origin-when-cross-origin"
     }
 
+    USER_CACHE_SIZE = 1024
+    USER_CACHE_TTL = 60
+
     @staticmethod
     def get_security_headers():
         return SecurityConfig.SECURITY_HEADERS
 
+user_cache = TTLCache(
+    maxsize=SecurityConfig.USER_CACHE_SIZE,
+    ttl=SecurityConfig.USER_CACHE_TTL
+)
+
+token_cache = TokenCache(maxsize=TokenConfig.CACHE_SIZE)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    to_encode = data.copy()
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=15))
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, SecurityConfig.SECRET_KEY, algorithm=SecurityConfig.ALGORITHM)
+
 class SecurityUtils:
     @staticmethod
     def generate_secure_token(length: int = 32) -> str:
@@ -120,6 +167,14 @@ class SecurityUtils:
     @staticmethod
     def get_password_hash(password: str) -> str:
         return pwd_context.hash(password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        return await password_hasher.hash(password)
         
     @staticmethod
     def generate_reset_token() -> str:
@@ -151,6 +206,17 @@ def require_permission(permission: UserPermission):
         return wrapper
     return decorator
 
+def permission_required(permission: UserPermission):
+    """Dependency that returns the current user if their role grants ``permission``."""
+    async def dependency(current_user: User = Depends(get_current_user)) -> User:
+        if permission.value not in ROLE_PERMISSIONS.get(current_user.role, []):
+            raise HTTPException(
+                status_code=403,
+                detail="Permission denied"
+            )
+        return current_user
+    return dependency
+
 def create_test_token(role: UserRole) -> str:
     """Creates a JWT token for testing purposes"""
     token_data = {
@@ -1,11 +1,173 @@
 from fastapi import Request
-from typing import Optional
+from typing import Callable, Optional
 from datetime import datetime, timedelta
+from src.cache import TTLCache
 import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
 
 class SessionConfig:
     SESSION_TIMEOUT = timedelta(minutes=30)
     REFRESH_TIMEOUT = timedelta(minutes=15)
+    COOKIE_NAME = "session"
+    COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "true").lower() != "false"
+    STORE_PATH = os.getenv("SESSION_DB_PATH", "./sessions.db")
+    CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "10000"))
+    # Each worker caches sessions for only this long, which bounds how long
+    # another worker can keep honouring a session after a logout.
+    CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "5"))
+    SQLITE_BUSY_TIMEOUT_MS = 5000
+    PURGE_INTERVAL_SECONDS = 300
+
+class SessionStore:
+    """Server-side sessions keyed by an opaque id: an LRU in front of SQLite.
+
+    Sessions are stored as their JSON encoding, which doubles as the snapshot
+    the middleware compares against to decide whether anything changed. A
+    session expires ``timeout`` after it was last written; the middleware
+    refreshes ``last_activity`` often enough to keep active sessions alive.
+
+    Every worker has its own cache, so entries are kept for ``cache_ttl``
+    only, and ``save`` writes only over the snapshot it was given: a stale
+    copy can neither overwrite newer data nor bring back a deleted session.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        ) WITHOUT ROWID
+    """
+
+    def __init__(
+        self,
+        path: str = SessionConfig.STORE_PATH,
+        cache_size: int = SessionConfig.CACHE_SIZE,
+        timeout: timedelta = SessionConfig.SESSION_TIMEOUT,
+        cache_ttl: float = SessionConfig.CACHE_TTL,
+        timer: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.timeout = timeout.total_seconds()
+        self.timer = timer
+        self.cache = TTLCache(cache_size, min(cache_ttl, self.timeout), timer=timer)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._next_purge = 0.0
+        self.reads = 0
+        self.writes = 0
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # Opened on first use so importing the app does not create the file.
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {SessionConfig.SQLITE_BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def dumps(data: dict) -> str:
+        return json.dumps(data, separators=(",", ":"), sort_keys=True)
+
+    @staticmethod
+    def loads(snapshot: Optional[str]) -> dict:
+        return json.loads(snapshot) if snapshot else {}
+
+    def load(self, session_id: str) -> Optional[str]:
+        """The stored JSON of a live session, or None."""
+        snapshot = self.cache.get(session_id)
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            self.reads += 1
+            row = self.conn.execute(
+                "SELECT data, expires_at FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        data, expires_at = row
+        remaining = expires_at - self.timer()
+        if remaining <= 0:
+            return None
+        self.cache.set(session_id, data, ttl=min(remaining, self.cache.ttl))
+        return data
+
+    def save(self, session_id: str, snapshot: str, previous: str) -> bool:
+        """Replace ``previous`` with ``snapshot``; False if the stored session is no longer ``previous``."""
+        now = self.timer()
+        with self._lock:
+            self.writes += 1
+            saved = self.conn.execute(
+                "UPDATE sessions SET data = ?, expires_at = ? "
+                "WHERE id = ? AND data = ? AND expires_at > ?",
+                (snapshot, now + self.timeout, session_id, previous, now)
+            ).rowcount == 1
+            self._purge(now)
+        if saved:
+            self.cache.set(session_id, snapshot)
+        else:
+            self.cache.pop(session_id)
+        return saved
+
+    def create(self, snapshot: str) -> str:
+        session_id = secrets.token_urlsafe(32)
+        now = self.timer()
+        with self._lock:
+            self.writes += 1
+            self.conn.execute(
+                "INSERT INTO sessions (id, data, expires_at) VALUES (?, ?, ?)",
+                (session_id, snapshot, now + self.timeout)
+            )
+            self._purge(now)
+        self.cache.set(session_id, snapshot)
+        return session_id
+
+    def delete(self, session_id: str):
+        self.cache.pop(session_id)
+        with self._lock:
+            self.writes += 1
+            self.conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    def _purge(self, now: float):
+        if now < self._next_purge:
+            return
+        self._next_purge = now + SessionConfig.PURGE_INTERVAL_SECONDS
+        self.conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+
+    def stats(self) -> dict:
+        return {**self.cache.stats(), "reads": self.reads, "writes": self.writes}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+def principal(session: dict) -> Optional[tuple]:
+    """Who a session belongs to; None while it is anonymous."""
+    data = session.get("session")
+    if not data:
+        return None
+    return data.get("user_id"), data.get("username")
+
+def touch(session: dict, now: Optional[datetime] = None) -> bool:
+    """Refresh ``last_activity`` if it is older than ``REFRESH_TIMEOUT``."""
+    data = session.get("session")
+    if not data:
+        return False
+    now = now or datetime.utcnow()
+    last_activity = data.get("last_activity")
+    if last_activity and now - datetime.fromisoformat(last_activity) < SessionConfig.REFRESH_TIMEOUT:
+        return False
+    session["session"] = {**data, "last_activity": now.isoformat()}
+    return True
 
 class SessionData:
     def __init__(self, user_id: int, username: str, role: str):
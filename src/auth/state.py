@@ -0,0 +1,249 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Protocol
+import os
+import sqlite3
+import threading
+import time
+
+class StateConfig:
+    BACKEND = os.getenv("STATE_BACKEND", "memory")
+    SQLITE_PATH = os.getenv("STATE_DB_PATH", "./state.db")
+    SQLITE_BUSY_TIMEOUT_MS = 5000
+    SWEEP_INTERVAL_SECONDS = 60
+
+class WindowState:
+    __slots__ = ("index", "current", "previous")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, index: int):
+        if index == self.index:
+            return
+        self.previous = self.current if index == self.index + 1 else 0
+        self.current = 0
+        self.index = index
+
+class SlidingWindowCounter:
+    """Sliding-window counter with constant work and memory per client.
+
+    Each client keeps only the hit counts of the current and previous fixed
+    window; the sliding count is the previous window weighted by how much of it
+    still overlaps, plus the current one. Clients are kept in least-recently-seen
+    order so idle ones can be dropped a few at a time on each hit instead of
+    scanning the whole table.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        sweep_batch: int = 8,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        self.window = window
+        self.sweep_batch = sweep_batch
+        self.timer = timer
+        self.clients: "OrderedDict[str, WindowState]" = OrderedDict()
+
+    def _state(self, key: str, index: int) -> WindowState:
+        state = self.clients.get(key)
+        if state is None:
+            state = self.clients[key] = WindowState(index)
+        else:
+            self.clients.move_to_end(key)
+            state.roll(index)
+        return state
+
+    def _estimate(self, state: WindowState, now: float) -> float:
+        overlap = 1.0 - (now % self.window) / self.window
+        return state.previous * overlap + state.current
+
+    def hit(self, key: str, limit: int, now: Optional[float] = None) -> bool:
+        """Count a hit for ``key`` unless that would exceed ``limit``."""
+        now = self.timer() if now is None else now
+        index = int(now // self.window)
+        state = self._state(key, index)
+        allowed = self._estimate(state, now) < limit
+        if allowed:
+            state.current += 1
+        self.sweep(index)
+        return allowed
+
+    def add(self, key: str, now: Optional[float] = None) -> float:
+        """Count a hit unconditionally and return the new sliding count."""
+        now = self.timer() if now is None else now
+        index = int(now // self.window)
+        state = self._state(key, index)
+        state.current += 1
+        self.sweep(index)
+        return self._estimate(state, now)
+
+    def count(self, key: str, now: Optional[float] = None) -> float:
+        now = self.timer() if now is None else now
+        state = self.clients.get(key)
+        if state is None:
+            return 0.0
+        state.roll(int(now // self.window))
+        return self._estimate(state, now)
+
+    def reset(self, key: str):
+        self.clients.pop(key, None)
+
+    def sweep(self, index: int):
+        # Oldest entries sit at the front; anything last seen two or more
+        # windows ago no longer contributes to its sliding count.
+        for _ in range(self.sweep_batch):
+            if not self.clients:
+                return
+            key, state = next(iter(self.clients.items()))
+            if state.index >= index - 1:
+                return
+            del self.clients[key]
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+class StateBackend(Protocol):
+    def hit(self, key: str, limit: int, window: float) -> bool: ...
+    def add(self, key: str, window: float) -> float: ...
+    def count(self, key: str, window: float) -> float: ...
+    def reset(self, key: str, window: float): ...
+
+class MemoryStateBackend:
+    """Per-process counters; each worker enforces its own limits."""
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic):
+        self.timer = timer
+        self.counters: Dict[float, SlidingWindowCounter] = {}
+
+    def _counter(self, window: float) -> SlidingWindowCounter:
+        counter = self.counters.get(window)
+        if counter is None:
+            counter = self.counters[window] = SlidingWindowCounter(window, timer=self.timer)
+        return counter
+
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        return self._counter(window).hit(key, limit)
+
+    def add(self, key: str, window: float) -> float:
+        return self._counter(window).add(key)
+
+    def count(self, key: str, window: float) -> float:
+        return self._counter(window).count(key)
+
+    def reset(self, key: str, window: float):
+        self._counter(window).reset(key)
+
+# Column values after rolling the stored window forward to :idx. In an UPDATE
+# SQLite evaluates every right-hand side against the old row, so these can be
+# reused across the SET list.
+_PREVIOUS = "(CASE WHEN idx >= :idx THEN previous WHEN idx = :idx - 1 THEN current ELSE 0 END)"
+_CURRENT = "(CASE WHEN idx >= :idx THEN current ELSE 0 END)"
+_UNDER_LIMIT = f"({_PREVIOUS} * :overlap + {_CURRENT} < :limit)"
+
+class SQLiteStateBackend:
+    """Counters in a WAL-mode SQLite file shared by every worker on the host.
+
+    Check-and-increment is a single ``INSERT ... ON CONFLICT DO UPDATE ...
+    RETURNING`` statement, so concurrent workers cannot both take the last slot.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS counters (
+            key TEXT NOT NULL,
+            window REAL NOT NULL,
+            idx INTEGER NOT NULL,
+            current INTEGER NOT NULL,
+            previous INTEGER NOT NULL,
+            allowed INTEGER NOT NULL,
+            PRIMARY KEY (key, window)
+        ) WITHOUT ROWID
+    """
+
+    HIT = f"""
+        INSERT INTO counters (key, window, idx, current, previous, allowed)
+        VALUES (:key, :window, :idx, :limit > 0, 0, :limit > 0)
+        ON CONFLICT (key, window) DO UPDATE SET
+            previous = {_PREVIOUS},
+            current = {_CURRENT} + {_UNDER_LIMIT},
+            allowed = {_UNDER_LIMIT},
+            idx = MAX(idx, :idx)
+        RETURNING allowed
+    """
+
+    ADD = f"""
+        INSERT INTO counters (key, window, idx, current, previous, allowed)
+        VALUES (:key, :window, :idx, 1, 0, 1)
+        ON CONFLICT (key, window) DO UPDATE SET
+            previous = {_PREVIOUS},
+            current = {_CURRENT} + 1,
+            idx = MAX(idx, :idx)
+        RETURNING previous * :overlap + current
+    """
+
+    COUNT = f"""
+        SELECT {_PREVIOUS} * :overlap + {_CURRENT}
+        FROM counters WHERE key = :key AND window = :window
+    """
+
+    def __init__(self, path: str = StateConfig.SQLITE_PATH, timer: Callable[[], float] = time.time):
+        self.path = path
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.execute(f"PRAGMA busy_timeout = {StateConfig.SQLITE_BUSY_TIMEOUT_MS}")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(self.SCHEMA)
+
+    def _execute(self, sql: str, key: str, window: float, limit: int = 0) -> Optional[tuple]:
+        now = self.timer()
+        params = {
+            "key": key,
+            "window": window,
+            "idx": int(now // window),
+            "overlap": 1.0 - (now % window) / window,
+            "limit": limit
+        }
+        with self._lock:
+            row = self.conn.execute(sql, params).fetchone()
+            if now >= self._next_sweep:
+                self._sweep(now)
+        return row
+
+    def _sweep(self, now: float):
+        # Rows last touched two or more windows ago count as zero anyway.
+        self.conn.execute(
+            "DELETE FROM counters WHERE idx < CAST(:now / window AS INTEGER) - 1",
+            {"now": now}
+        )
+        self._next_sweep = now + StateConfig.SWEEP_INTERVAL_SECONDS
+
+    def hit(self, key: str, limit: int, window: float) -> bool:
+        return bool(self._execute(self.HIT, key, window, limit)[0])
+
+    def add(self, key: str, window: float) -> float:
+        return self._execute(self.ADD, key, window)[0]
+
+    def count(self, key: str, window: float) -> float:
+        row = self._execute(self.COUNT, key, window)
+        return row[0] if row else 0.0
+
+    def reset(self, key: str, window: float):
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM counters WHERE key = ? AND window = ?", (key, window)
+            )
+
+    def close(self):
+        self.conn.close()
+
+def create_state_backend(kind: str = StateConfig.BACKEND) -> StateBackend:
+    if kind == "memory":
+        return MemoryStateBackend()
+    if kind == "sqlite":
+        return SQLiteStateBackend(StateConfig.SQLITE_PATH)
+    raise ValueError(f"Unknown state backend: {kind}")
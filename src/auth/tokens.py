@@ -0,0 +1,84 @@
+from jose import jwt, JWTError
+from jose.exceptions import ExpiredSignatureError
+from typing import Any, Callable, Dict, Optional
+from src.cache import TTLCache
+import base64
+import binascii
+import hashlib
+import json
+import time
+
+class TokenConfig:
+    CACHE_SIZE = 4096
+    # Longest a verified token is served from the cache without re-checking,
+    # even if its exp is further out.
+    MAX_CACHE_SECONDS = 300
+    MAX_TOKEN_LENGTH = 4096
+
+def _unverified_claims(token: str) -> Dict[str, Any]:
+    """Parse the payload segment without checking the signature."""
+    if len(token) > TokenConfig.MAX_TOKEN_LENGTH or token.count(".") != 2:
+        raise JWTError("Malformed token")
+    payload = token.split(".", 2)[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (binascii.Error, ValueError):
+        raise JWTError("Malformed token")
+    if not isinstance(claims, dict):
+        raise JWTError("Malformed token")
+    return claims
+
+class TokenCache:
+    """Verified JWT claims keyed by the SHA-256 digest of the token.
+
+    A browser reuses one token for many requests, so after the first full
+    ``jwt.decode`` later requests cost a hash and a dict lookup. Entries expire
+    with the token's ``exp`` (capped at ``max_age``). Malformed and expired
+    tokens are rejected from the unverified payload before any signature work;
+    that check only ever rejects, so it cannot let a forged token through.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = TokenConfig.CACHE_SIZE,
+        max_age: float = TokenConfig.MAX_CACHE_SECONDS,
+        timer: Callable[[], float] = time.time
+    ):
+        self.max_age = max_age
+        self.timer = timer
+        self.cache = TTLCache(maxsize, max_age, timer=timer)
+        self.rejected = 0
+
+    def decode(self, token: str, key: str, algorithm: str) -> Dict[str, Any]:
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = self.cache.get(digest)
+        if claims is not None:
+            return dict(claims)
+
+        exp = self._check_expiry(token)
+        claims = jwt.decode(token, key, algorithms=[algorithm])
+        ttl = self.max_age if exp is None else min(self.max_age, exp - self.timer())
+        if ttl > 0:
+            self.cache.set(digest, claims, ttl=ttl)
+        return dict(claims)
+
+    def _check_expiry(self, token: str) -> Optional[float]:
+        try:
+            claims = _unverified_claims(token)
+            exp = claims.get("exp")
+            if exp is None:
+                return None
+            if not isinstance(exp, (int, float)):
+                raise JWTError("Invalid exp claim")
+            if exp <= self.timer():
+                raise ExpiredSignatureError("Signature has expired.")
+            return exp
+        except JWTError:
+            self.rejected += 1
+            raise
+
+    def clear(self):
+        self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.cache.stats(), "rejected": self.rejected}
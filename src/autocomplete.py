@@ -0,0 +1,177 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from models.product import Product
+from src.cache import TTLCache
+import heapq
+import os
+import threading
+import time
+
+class AutocompleteConfig:
+    MIN_QUERY_LENGTH = 3
+    # Each worker process has its own index and only sees its own writes
+    # incrementally; other workers' writes show up after this long.
+    MAX_AGE_SECONDS = int(os.getenv("AUTOCOMPLETE_MAX_AGE", "300"))
+    RESULT_CACHE_SIZE = 512
+    RESULT_CACHE_TTL = 30
+    # Match lists longer than this are not worth keeping for refinement.
+    MAX_CACHED_MATCHES = 5000
+
+# internal_id -> (id, product_name, folded id, folded name, folded "id\nname")
+Entry = Tuple[str, str, str, str, str]
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _entry(product_id: str, name: str) -> Entry:
+    folded_id, folded_name = product_id.casefold(), name.casefold()
+    return product_id, name, folded_id, folded_name, f"{folded_id}\n{folded_name}"
+
+class _IndexState:
+    __slots__ = ("products", "postings")
+
+    def __init__(self):
+        self.products: Dict[int, Entry] = {}
+        self.postings: Dict[str, Set[int]] = {}
+
+    def add(self, internal_id: int, entry: Entry):
+        self.products[internal_id] = entry
+        for gram in trigrams(entry[4]):
+            self.postings.setdefault(gram, set()).add(internal_id)
+
+    def remove(self, internal_id: int):
+        entry = self.products.pop(internal_id, None)
+        if entry is None:
+            return
+        for gram in trigrams(entry[4]):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(internal_id)
+                if not ids:
+                    del self.postings[gram]
+
+class ProductIndex:
+    """In-process trigram index over product ids and names.
+
+    A query's trigram posting lists are intersected (smallest first) and the
+    survivors checked for the full substring. Full match lists are kept
+    briefly, so as the user keeps typing, "abcd" is answered by filtering the
+    cached matches of "abc" instead of going back to the postings.
+
+    Committed ORM changes are applied incrementally through session events.
+    Bulk imports bypass the ORM, so they call ``rebuild``, which builds a new
+    index on the side and swaps it in with one assignment.
+    """
+
+    def __init__(self, timer=time.monotonic):
+        self.timer = timer
+        self._state = _IndexState()
+        self._lock = threading.Lock()
+        self.results = TTLCache(AutocompleteConfig.RESULT_CACHE_SIZE, AutocompleteConfig.RESULT_CACHE_TTL, timer=timer)
+        self.loaded_at: Optional[float] = None
+        self.generation = 0
+        self.refinements = 0
+
+    def needs_refresh(self) -> bool:
+        return self.loaded_at is None or self.timer() - self.loaded_at > AutocompleteConfig.MAX_AGE_SECONDS
+
+    def rebuild(self, rows: Iterable[Tuple[int, str, str]], generation: Optional[int] = None):
+        """Replace the index with ``rows`` of (internal_id, id, product_name).
+
+        ``generation`` is the value read before ``rows`` were queried; if
+        incremental updates landed in between, the new index may miss them,
+        so it is marked for another refresh.
+        """
+        state = _IndexState()
+        for internal_id, product_id, name in rows:
+            state.add(internal_id, _entry(product_id, name))
+        with self._lock:
+            self._state = state
+            self.results.clear()
+            current = generation is None or generation == self.generation
+            self.loaded_at = self.timer() if current else None
+
+    def apply(self, changes: Dict[int, Optional[Tuple[str, str]]]):
+        """Apply committed changes: internal_id -> (id, name), or None if deleted."""
+        with self._lock:
+            for internal_id, values in changes.items():
+                self._state.remove(internal_id)
+                if values is not None:
+                    self._state.add(internal_id, _entry(*values))
+            self.generation += 1
+            self.results.clear()
+
+    def clear(self):
+        with self._lock:
+            self._state = _IndexState()
+            self.results.clear()
+            self.loaded_at = None
+
+    def _matches(self, query: str) -> List[int]:
+        state = self._state
+        for end in range(len(query) - 1, AutocompleteConfig.MIN_QUERY_LENGTH - 1, -1):
+            cached = self.results.get(query[:end])
+            if cached is not None:
+                self.refinements += 1
+                return [i for i in cached if query in state.products[i][4]]
+        postings = sorted((state.postings.get(gram, ()) for gram in trigrams(query)), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [i for i in candidates if query in state.products[i][4]]
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
+        query = query.strip().casefold()
+        if len(query) < AutocompleteConfig.MIN_QUERY_LENGTH:
+            return []
+        with self._lock:
+            matches = self.results.get(query)
+            if matches is None:
+                matches = self._matches(query)
+                if len(matches) <= AutocompleteConfig.MAX_CACHED_MATCHES:
+                    self.results.set(query, matches)
+            products = self._state.products
+
+            def rank(internal_id: int):
+                _, _, folded_id, folded_name, _ = products[internal_id]
+                prefix = 0 if folded_id.startswith(query) else 1 if folded_name.startswith(query) else 2
+                return prefix, folded_name, folded_id
+
+            best = heapq.nsmallest(limit, matches, key=rank)
+            return [
+                {"internal_id": i, "id": products[i][0], "product_name": products[i][1]}
+                for i in best
+            ]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "products": len(self._state.products),
+            "trigrams": len(self._state.postings),
+            "refinements": self.refinements,
+            "results": self.results.stats()
+        }
+
+product_index = ProductIndex()
+
+_CHANGES_KEY = "product_index_changes"
+
+@event.listens_for(Session, "after_flush")
+def _collect_product_changes(session, flush_context):
+    # Values are captured here because they are expired after the commit.
+    for obj in session.new | session.dirty:
+        if isinstance(obj, Product):
+            session.info.setdefault(_CHANGES_KEY, {})[obj.internal_id] = (obj.id, obj.product_name)
+    for obj in session.deleted:
+        if isinstance(obj, Product):
+            session.info.setdefault(_CHANGES_KEY, {})[obj.internal_id] = None
+
+@event.listens_for(Session, "after_commit")
+def _apply_product_changes(session):
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if changes:
+        product_index.apply(changes)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_product_changes(session):
+    session.info.pop(_CHANGES_KEY, None)
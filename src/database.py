@@ -1,16 +1,235 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from typing import Any, Callable, Dict, Optional
+import os
+import threading
+import time
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+class DatabaseConfig:
+    URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+    ASYNC_URL = os.getenv("ASYNC_DATABASE_URL", "sqlite+aiosqlite:///./app.db")
+    PROFILE = os.getenv("DB_PROFILE", "development")
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Handler names (e.g. "read_user,read_users") served by the async session.
+    # Everything else keeps the sync session, run through the threadpool.
+    ASYNC_ROUTES = frozenset(
+        name.strip() for name in os.getenv("ASYNC_DB_ROUTES", "").split(",") if name.strip()
+    )
+
+    PROFILES: Dict[str, Dict[str, Any]] = {
+        "development": {
+            "pool_size": 5,
+            "max_overflow": 5,
+            "pool_timeout": 30,
+            "pragmas": {
+                "journal_mode": "WAL",
+                "busy_timeout": 5000,
+                "foreign_keys": "ON"
+            }
+        },
+        "production": {
+            "pool_size": 10,
+            "max_overflow": 10,
+            "pool_timeout": 10,
+            "pragmas": {
+                "journal_mode": "WAL",
+                "synchronous": "NORMAL",
+                "busy_timeout": 5000,
+                "cache_size": -64000,
+                "mmap_size": 268435456,
+                "temp_store": "MEMORY",
+                "foreign_keys": "ON"
+            }
+        },
+        "test": {
+            "pool_size": 5,
+            "max_overflow": 5,
+            "pool_timeout": 5,
+            "pragmas": {
+                "busy_timeout": 5000,
+                "foreign_keys": "ON"
+            }
+        }
+    }
+
+    @staticmethod
+    def engine_settings(profile: Optional[str] = None) -> Dict[str, Any]:
+        name = profile or DatabaseConfig.PROFILE
+        if name not in DatabaseConfig.PROFILES:
+            raise ValueError(f"Unknown database profile: {name}")
+        settings = dict(DatabaseConfig.PROFILES[name])
+        settings["pragmas"] = dict(settings["pragmas"])
+        for key in ("pool_size", "max_overflow", "pool_timeout"):
+            override = os.getenv(f"DB_{key.upper()}")
+            if override is not None:
+                settings[key] = int(override)
+        busy_timeout = os.getenv("DB_BUSY_TIMEOUT_MS")
+        if busy_timeout is not None:
+            settings["pragmas"]["busy_timeout"] = int(busy_timeout)
+        return settings
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+class InstrumentedPoolMixin:
+    """Times how long callers wait for a pooled connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    # _do_get is where QueuePool blocks for a free connection, so timing it
+    # gives the checkout wait without counting connection reuse.
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def apply_pragmas(engine: Engine, pragmas: Dict[str, Any]):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+def _engine_arguments(url: str, settings: Dict[str, Any], pool_class) -> Dict[str, Any]:
+    if make_url(url).database in (None, "", ":memory:"):
+        # Every connection to :memory: is a separate database; share one.
+        return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    return {
+        "poolclass": pool_class,
+        "pool_size": settings["pool_size"],
+        "max_overflow": settings["max_overflow"],
+        "pool_timeout": settings["pool_timeout"],
+        # Sync sessions are handed to threadpool workers, so a connection
+        # must be usable from a thread other than the one that opened it.
+        "connect_args": {"check_same_thread": False}
+    }
+
+def create_db_engine(url: Optional[str] = None, profile: Optional[str] = None) -> Engine:
+    url = url or DatabaseConfig.URL
+    settings = DatabaseConfig.engine_settings(profile)
+    engine = create_engine(url, **_engine_arguments(url, settings, InstrumentedQueuePool))
+    apply_pragmas(engine, settings["pragmas"])
+    return engine
+
+def create_async_db_engine(url: Optional[str] = None, profile: Optional[str] = None):
+    url = url or DatabaseConfig.ASYNC_URL
+    settings = DatabaseConfig.engine_settings(profile)
+    engine = create_async_engine(url, **_engine_arguments(url, settings, InstrumentedAsyncQueuePool))
+    apply_pragmas(engine.sync_engine, settings["pragmas"])
+    return engine
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": pool.overflow()
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        checkouts = metrics.checkouts or 1
+        stats.update({
+            "checkouts": metrics.checkouts,
+            "timeouts": metrics.timeouts,
+            "avg_wait_ms": round(metrics.total_wait / checkouts * 1000, 3),
+            "max_wait_ms": round(metrics.max_wait * 1000, 3)
+        })
+    return stats
+
+class _Lazy:
+    """Calls ``factory`` once, on first use, and keeps the result."""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self.value = None
+        self._lock = threading.Lock()
+
+    @property
+    def created(self) -> bool:
+        return self.value is not None
+
+    def __call__(self) -> Any:
+        if self.value is None:
+            with self._lock:
+                if self.value is None:
+                    self.value = self.factory()
+        return self.value
+
+# Engines and session factories are built on the first session, not at import,
+# so importing the app (or a tool that only needs the models) opens nothing.
+get_engine = _Lazy(create_db_engine)
+get_async_engine = _Lazy(create_async_db_engine)
+get_session_factory = _Lazy(lambda: sessionmaker(autocommit=False, autoflush=False, bind=get_engine()))
+get_async_session_factory = _Lazy(
+    lambda: async_sessionmaker(get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+)
 Base = declarative_base()
 
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "SessionLocal": get_session_factory,
+    "AsyncSessionLocal": get_async_session_factory
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+async def dispose_engines():
+    if get_async_engine.created:
+        await get_async_engine().dispose()
+    if get_engine.created:
+        get_engine().dispose()
+
 def get_db():
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+
+def db_session(route: str):
+    """Session dependency for the handler named ``route``."""
+    return get_async_db if route in DatabaseConfig.ASYNC_ROUTES else get_db
@@ -0,0 +1,42 @@
+from fastapi import Depends, HTTPException, Request, Response
+from typing import Dict, Iterable
+from models import async_crud, crud
+from src.database import db_session
+import hashlib
+
+def make_etag(versions: Dict[str, int], request: Request) -> str:
+    """Weak ETag for ``request`` given the versions of the tables it reads.
+
+    The path and sorted query string are part of the tag, so every filter,
+    sort and page of a list gets its own.
+    """
+    query = sorted(request.query_params.multi_items())
+    key = f"{request.url.path}?{query}|{sorted(versions.items())}"
+    return f'W/"{hashlib.sha256(key.encode()).hexdigest()[:24]}"'
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def conditional(route: str, tables: Iterable[str]):
+    """Dependency answering a matching If-None-Match with 304 before the handler runs.
+
+    Only the version counters of ``tables`` are read; the route's own query
+    and serialization are skipped entirely when the client is up to date.
+    """
+    names = list(tables)
+
+    async def check(request: Request, response: Response, db=Depends(db_session(route))) -> str:
+        versions = await async_crud.run(db, crud.get_table_versions, names)
+        etag = make_etag(versions, request)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return etag
+
+    return check
@@ -0,0 +1,73 @@
+from fastapi import HTTPException, UploadFile
+from typing import Any, BinaryIO, Dict, Iterator, List, Sequence, Tuple
+import csv
+import io
+import os
+
+class ImportConfig:
+    # Uploads are spooled to disk by the multipart parser and read back
+    # incrementally, so this caps disk use rather than memory.
+    MAX_UPLOAD_BYTES = int(os.getenv("IMPORT_MAX_BYTES", str(64 * 1024 * 1024)))
+    BATCH_SIZE = 1000
+    MAX_REPORTED_ERRORS = 1000
+
+class ImportReport:
+    """Counts plus the first ``MAX_REPORTED_ERRORS`` per-row errors."""
+
+    def __init__(self):
+        self.processed = 0
+        self.imported = 0
+        self.failed = 0
+        self.rolled_back = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    def error(self, line: int, message: str):
+        self.failed += 1
+        if len(self.errors) < ImportConfig.MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def stage(self, name: str, seconds: float, rows: int):
+        self.stages[name] = {
+            "seconds": round(seconds, 4),
+            "rows_per_second": round(rows / seconds, 1) if seconds else 0.0
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "imported": self.imported,
+            "failed": self.failed,
+            "rolled_back": self.rolled_back,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "stages": self.stages
+        }
+
+def check_upload_size(upload: UploadFile):
+    if upload.size is not None and upload.size > ImportConfig.MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File larger than {ImportConfig.MAX_UPLOAD_BYTES} bytes"
+        )
+
+def read_csv(source: BinaryIO, required: Sequence[str]) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Yield ``(line, row)`` from a UTF-8 CSV (with or without BOM), one row at a time."""
+    text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = [column for column in required if column not in (reader.fieldnames or ())]
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Missing required columns: {', '.join(missing)}")
+        for row in reader:
+            yield reader.line_num, row
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File is not valid UTF-8")
+    except csv.Error as e:
+        raise HTTPException(status_code=400, detail=f"Malformed CSV: {e}")
+    finally:
+        # Leave the upload open for its owner.
+        text.detach()
+
+def field(row: Dict[str, str], name: str) -> str:
+    return (row.get(name) or "").strip()
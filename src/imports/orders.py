@@ -0,0 +1,236 @@
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from collections import deque
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from models.order import Order, OrderStatus
+from models.product import Product
+from src.imports.common import ImportReport, field, read_csv
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+ORDER_COLUMNS = ("order_number", "customer_name", "project_name", "product_list", "status")
+ALLOWED_STATUSES = frozenset(status.value for status in OrderStatus)
+MAX_NOTES_LENGTH = Order.notes.type.length
+
+class OrderImportConfig:
+    CHUNK_SIZE = 2000
+    # One core stays with the importing process, which reads and writes. With
+    # no workers left, validation runs inline.
+    WORKERS = int(os.getenv("IMPORT_WORKERS", str(min(4, (os.cpu_count() or 1) - 1))))
+    # Chunks queued per worker; bounds memory when parsing outruns validation.
+    IN_FLIGHT_PER_WORKER = 2
+
+class RollbackPolicy(str, Enum):
+    ROW = "row"        # skip invalid rows, import the rest
+    CHUNK = "chunk"    # drop every chunk that contains an invalid row
+    ALL = "all"        # import nothing if any row is invalid
+
+Row = Tuple[int, Dict[str, str]]
+Validated = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+def parse_product_list(raw: str) -> List[Dict[str, Any]]:
+    """Normalise a ``product_list`` cell to ``[{"id": str, "quantity": int}, ...]``."""
+    items = json.loads(raw)
+    if not isinstance(items, list) or not items:
+        raise ValueError("product_list must be a non-empty JSON array")
+    products = []
+    for item in items:
+        if isinstance(item, (str, int)) and not isinstance(item, bool):
+            item = {"id": item}
+        if not isinstance(item, dict) or not isinstance(item.get("id"), (str, int)):
+            raise ValueError("product_list items need an id")
+        quantity = item.get("quantity", 1)
+        if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity < 1:
+            raise ValueError("product quantity must be a positive integer")
+        products.append({"id": str(item["id"]), "quantity": quantity})
+    return products
+
+def validate_row(row: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    values = {name: field(row, name) for name in ORDER_COLUMNS}
+    for name in ORDER_COLUMNS:
+        if not values[name]:
+            return None, f"{name} is required"
+    if values["status"] not in ALLOWED_STATUSES:
+        return None, f"Invalid status: {values['status']}"
+    try:
+        values["product_list"] = parse_product_list(values["product_list"])
+    except ValueError as e:
+        return None, f"Invalid product_list: {e}"
+    notes = field(row, "notes")
+    if len(notes) > MAX_NOTES_LENGTH:
+        return None, f"notes longer than {MAX_NOTES_LENGTH} characters"
+    values["notes"] = notes or None
+    values["delivery_link"] = field(row, "delivery_link") or None
+    values["invoice_link"] = field(row, "invoice_link") or None
+    return values, None
+
+def validate_chunk(rows: List[Row]) -> Tuple[List[Validated], float]:
+    """Validate rows that need no database access; runs in a worker process."""
+    started = time.perf_counter()
+    results = [(line, *validate_row(row)) for line, row in rows]
+    return results, time.perf_counter() - started
+
+class ValidationPool:
+    """Process pool for order validation, started on first use.
+
+    Workers are spawned rather than forked, since the server process has
+    threads (threadpool, log pipeline) whose locks a fork could copy mid-use.
+    """
+
+    def __init__(self, workers: int = OrderImportConfig.WORKERS):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+validation_pool = ValidationPool()
+
+def _chunks(rows: Iterable[Row], size: int, timings: Dict[str, float]) -> Iterator[List[Row]]:
+    rows = iter(rows)
+    while True:
+        started = time.perf_counter()
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == size:
+                break
+        timings["read"] += time.perf_counter() - started
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < size:
+            return
+
+def _validated(
+    chunks: Iterator[List[Row]],
+    chunk_size: int,
+    pool: Optional[ValidationPool],
+    timings: Dict[str, float]
+) -> Iterator[List[Validated]]:
+    """Validated chunks in input order, in parallel when a pool is given."""
+    first = next(chunks, None)
+    if first is None:
+        return
+    # A file that fits in one chunk is cheaper to validate than to ship to a worker.
+    if pool is None or pool.workers < 1 or len(first) < chunk_size:
+        for chunk in itertools.chain([first], chunks):
+            results, seconds = validate_chunk(chunk)
+            timings["validate"] += seconds
+            yield results
+        return
+
+    executor = pool.executor
+    pending = deque([executor.submit(validate_chunk, first)])
+    for chunk in chunks:
+        pending.append(executor.submit(validate_chunk, chunk))
+        if len(pending) >= pool.workers * OrderImportConfig.IN_FLIGHT_PER_WORKER:
+            results, seconds = pending.popleft().result()
+            timings["validate"] += seconds
+            yield results
+    while pending:
+        results, seconds = pending.popleft().result()
+        timings["validate"] += seconds
+        yield results
+
+def import_orders(
+    db: Session,
+    source: BinaryIO,
+    policy: RollbackPolicy = RollbackPolicy.ROW,
+    chunk_size: int = OrderImportConfig.CHUNK_SIZE,
+    pool: Optional[ValidationPool] = validation_pool
+) -> ImportReport:
+    """Import an orders CSV through a read -> validate -> resolve -> write pipeline.
+
+    Parsing the JSON product lists and checking fields happens in ``pool``
+    while the next chunks are read. Order-number uniqueness and product ids
+    are then checked in this process against sets loaded once up front, and
+    chunks are written in input order, one executemany each. ``policy``
+    decides what an invalid row costs: itself, its chunk, or the whole import
+    (chunks are committed as they go except under ``ALL``).
+    """
+    report = ImportReport()
+    timings = {"read": 0.0, "validate": 0.0, "resolve": 0.0, "write": 0.0}
+    started = time.perf_counter()
+    products = dict(db.execute(select(Product.id, Product.internal_id)).all())
+    order_numbers = set(db.execute(select(Order.order_number)).scalars())
+    timings["resolve"] += time.perf_counter() - started
+    statement = Order.__table__.insert()
+    pending = 0
+
+    chunks = _chunks(read_csv(source, ORDER_COLUMNS), chunk_size, timings)
+    try:
+        for results in _validated(chunks, chunk_size, pool, timings):
+            started = time.perf_counter()
+            valid = []
+            chunk_numbers = set()
+            for line, values, error in results:
+                report.processed += 1
+                if error is None:
+                    number = values["order_number"]
+                    unknown = [p["id"] for p in values["product_list"] if p["id"] not in products]
+                    if number in order_numbers or number in chunk_numbers:
+                        error = f"Duplicate order number: {number}"
+                    elif unknown:
+                        error = f"Unknown product ids: {', '.join(unknown)}"
+                if error is not None:
+                    report.error(line, error)
+                    continue
+                chunk_numbers.add(number)
+                valid.append(values)
+            timings["resolve"] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            chunk_failed = len(valid) < len(results)
+            if policy is RollbackPolicy.ALL:
+                if report.failed:
+                    report.rolled_back += len(valid)
+                elif valid:
+                    db.execute(statement, valid)
+                    pending += len(valid)
+                order_numbers |= chunk_numbers
+            elif policy is RollbackPolicy.CHUNK and chunk_failed:
+                report.rolled_back += len(valid)
+            elif valid:
+                db.execute(statement, valid)
+                db.commit()
+                report.imported += len(valid)
+                order_numbers |= chunk_numbers
+            timings["write"] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        if policy is RollbackPolicy.ALL:
+            if report.failed:
+                db.rollback()
+                report.rolled_back += pending
+            else:
+                db.commit()
+                report.imported = pending
+        timings["write"] += time.perf_counter() - started
+    except Exception:
+        db.rollback()
+        raise
+
+    for name, seconds in timings.items():
+        report.stage(name, seconds, report.processed)
+    return report
@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import BinaryIO
+from models.product import Product
+from src.imports.common import ImportConfig, ImportReport, field, read_csv
+
+PRODUCT_COLUMNS = ("id", "product_name")
+MAX_NAME_LENGTH = Product.product_name.type.length
+
+def import_products(db: Session, source: BinaryIO, batch_size: int = ImportConfig.BATCH_SIZE) -> ImportReport:
+    """Import a products CSV in one transaction, skipping and reporting invalid rows.
+
+    Rows are parsed as they are read and inserted ``batch_size`` at a time with
+    a single executemany each. Product ids already in the table or earlier in
+    the file are rejected from an in-memory set, so no per-row SELECT is issued.
+    """
+    report = ImportReport()
+    seen = set(db.execute(select(Product.id)).scalars())
+    statement = Product.__table__.insert()
+    batch = []
+    try:
+        for line, row in read_csv(source, PRODUCT_COLUMNS):
+            report.processed += 1
+            product_id = field(row, "id")
+            name = field(row, "product_name")
+            if not product_id:
+                report.error(line, "id is required")
+            elif not name:
+                report.error(line, "product_name is required")
+            elif len(name) > MAX_NAME_LENGTH:
+                report.error(line, f"product_name longer than {MAX_NAME_LENGTH} characters")
+            elif product_id in seen:
+                report.error(line, f"Duplicate product id: {product_id}")
+            else:
+                seen.add(product_id)
+                batch.append({"id": product_id, "product_name": name})
+                if len(batch) >= batch_size:
+                    db.execute(statement, batch)
+                    report.imported += len(batch)
+                    batch = []
+        if batch:
+            db.execute(statement, batch)
+            report.imported += len(batch)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return report
@@ -1,55 +1,118 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import cookie_parser
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.auth.security import SecurityConfig
-from src.auth.session import SessionConfig, get_session_data, SessionData
-from datetime import datetime
-import time
-
-class SecurityMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        headers = SecurityConfig.get_security_headers()
-        for key, value in headers.items():
-            response.headers[key] = value
-        return response
-
-class SessionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        session_data = get_session_data(request)
-        if session_data:
-            now = datetime.utcnow()
-            session_data.last_activity = now
-            request.session["session"] = session_data.to_dict()
-        return await call_next(request)
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, requests_per_minute: int = 60):
-        super().__init__(app)
-        self.requests_per_minute = requests_per_minute
-        self.requests = {}
-
-    async def dispatch(self, request: Request, call_next):
-        client_ip = request.client.host
-        current_time = time.time()
-        
-        # Clean up old requests
-        self.requests = {ip: times for ip, times in self.requests.items()
-                        if current_time - times[-1] < 60}
-        
-        if client_ip in self.requests:
-            times = self.requests[client_ip]
-            if len(times) >= self.requests_per_minute:
-                if current_time - times[0] < 60:
-                    return Response(status_code=429, content="Too many requests")
-                times.pop(0)
-            times.append(current_time)
-        else:
-            self.requests[client_ip] = [current_time]
-            
-        return await call_next(request)
-
-# Export middleware classes
+from src.auth.rate_limit import RateLimiter
+from src.auth.session import SessionConfig, SessionStore, principal, touch
+from src.auth.state import StateBackend
+from typing import Optional
+
+class SecurityMiddleware:
+    """Rate limiting, sessions and security headers in one ASGI pass.
+
+    Over-limit clients get a 429 before routing runs. Security headers are
+    encoded once at startup and appended to ``http.response.start``, so no
+    response object is wrapped or rebuilt.
+
+    With a ``session_store`` the session is loaded from the store by the id in
+    the session cookie, and written back only when its JSON changed; the
+    cookie itself is sent only when a session is created or cleared. A
+    session whose user changes, as on login, gets a new id so an id handed
+    out before authentication can't be fixed onto the user. Without
+    one, Starlette's SessionMiddleware must sit outside this middleware so
+    ``scope["session"]`` is populated.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests_per_minute: int = 60,
+        state: Optional[StateBackend] = None,
+        session_store: Optional[SessionStore] = None,
+        limiter: Optional[RateLimiter] = None
+    ):
+        self.app = app
+        self.limiter = limiter or RateLimiter(requests_per_minute, backend=state)
+        self.sessions = session_store
+        self.raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in SecurityConfig.get_security_headers().items()
+        ]
+        self.too_many_requests = PlainTextResponse("Too many requests", status_code=429)
+        flags = "path=/; httponly; samesite=lax"
+        if SessionConfig.COOKIE_SECURE:
+            flags += "; secure"
+        self.cookie_flags = flags
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw_headers = self.raw_headers
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + raw_headers
+            await send(message)
+
+        client = scope.get("client")
+        if not self.limiter.allow(client[0] if client else "unknown"):
+            await self.too_many_requests(scope, receive, send_with_headers)
+            return
+
+        if self.sessions is None:
+            self.touch_session(scope)
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        cookie = self.session_cookie(scope)
+        snapshot = self.sessions.load(cookie) if cookie else None
+        session = SessionStore.loads(snapshot)
+        touch(session)
+        scope["session"] = session
+
+        async def send_with_session(message: Message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ())) + raw_headers
+                set_cookie = self.save_session(cookie, snapshot, session)
+                if set_cookie is not None:
+                    headers.append((b"set-cookie", set_cookie))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_session)
+
+    @staticmethod
+    def session_cookie(scope: Scope) -> Optional[str]:
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                return cookie_parser(value.decode("latin-1")).get(SessionConfig.COOKIE_NAME)
+        return None
+
+    def save_session(self, cookie: Optional[str], snapshot: Optional[str], session: dict) -> Optional[bytes]:
+        """Persist ``session`` if it changed; returns a Set-Cookie value when one is needed."""
+        if not session:
+            if snapshot is not None:
+                self.sessions.delete(cookie)
+            if cookie is None:
+                return None
+            return f"{SessionConfig.COOKIE_NAME}=null; max-age=0; {self.cookie_flags}".encode("latin-1")
+        current = SessionStore.dumps(session)
+        if current == snapshot:
+            return None
+        if snapshot is not None:
+            if principal(session) == principal(SessionStore.loads(snapshot)):
+                self.sessions.save(cookie, current, snapshot)
+                return None
+            self.sessions.delete(cookie)
+        session_id = self.sessions.create(current)
+        return f"{SessionConfig.COOKIE_NAME}={session_id}; {self.cookie_flags}".encode("latin-1")
+
+    @staticmethod
+    def touch_session(scope: Scope):
+        session = scope.get("session")
+        if session is not None:
+            touch(session)
+
 security_middleware = SecurityMiddleware
-rate_limit_middleware = RateLimitMiddleware
-session_middleware = SessionMiddleware
-error_handler_middleware = None  # Implement if needed
\ No newline at end of file
@@ -0,0 +1,106 @@
+from fastapi import HTTPException
+from sqlalchemy import Select, literal, tuple_
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from src.auth.security import SecurityConfig
+import base64
+import hashlib
+import hmac
+import json
+import os
+
+class PaginationConfig:
+    # Shared by all workers; defaults to a key derived from SECRET_KEY.
+    CURSOR_SECRET = os.getenv("CURSOR_SECRET")
+
+def cursor_key() -> bytes:
+    if PaginationConfig.CURSOR_SECRET:
+        return PaginationConfig.CURSOR_SECRET.encode()
+    return hmac.new(SecurityConfig.SECRET_KEY.encode(), b"pagination-cursor", hashlib.sha256).digest()
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+class Keyset:
+    """Keyset (seek) pagination over an ordered tuple of columns.
+
+    The last column must be unique (normally the primary key) so every row has
+    a distinct position. Pages are fetched with ``WHERE (a, b) > (:a, :b)``
+    instead of OFFSET, so page N costs the same as page 1 as long as an index
+    matches the column order. Cursors are signed and bound to ``scope`` (for
+    example the endpoint and sort), so a client cannot forge one or replay it
+    against a different ordering.
+    """
+
+    def __init__(self, *columns, descending: bool = False, scope: str = ""):
+        self.columns = columns
+        self.descending = descending
+        self.scope = f"{scope}:{'desc' if descending else 'asc'}"
+
+    def _signature(self, payload: bytes) -> bytes:
+        return hmac.new(cursor_key(), self.scope.encode() + b"|" + payload, hashlib.sha256).digest()[:16]
+
+    def encode_cursor(self, values: Sequence[Any]) -> str:
+        payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":")).encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._signature(payload))}"
+
+    def decode_cursor(self, cursor: str) -> List[Any]:
+        try:
+            payload_part, signature_part = cursor.split(".")
+            payload = _b64decode(payload_part)
+            if not hmac.compare_digest(_b64decode(signature_part), self._signature(payload)):
+                raise ValueError("bad signature")
+            values = [_decode_value(v) for v in json.loads(payload)]
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+        if len(values) != len(self.columns):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+        return values
+
+    def apply(self, statement: Select, cursor: Optional[str], limit: int, lookahead: bool = True) -> Select:
+        """Restrict ``statement`` to the page after ``cursor``.
+
+        With ``lookahead`` one extra row is fetched to tell whether a next page exists.
+        """
+        if cursor:
+            position = tuple_(*self.columns)
+            # Bound with each column's own type, so values compare the way
+            # they are stored (Timestamp text has no microseconds).
+            values = tuple_(*(literal(v, c.type) for c, v in zip(self.columns, self.decode_cursor(cursor))))
+            statement = statement.where(position < values if self.descending else position > values)
+        order = [c.desc() if self.descending else c.asc() for c in self.columns]
+        return statement.order_by(*order).limit(limit + 1 if lookahead else limit)
+
+    def keys(self, statement: Select, cursor: Optional[str], limit: int) -> Select:
+        """Only the key columns of this page plus one row, enough for ``next_cursor``."""
+        return self.apply(statement.with_only_columns(*self.columns), cursor, limit)
+
+    def next_cursor(self, key_rows: Sequence[Sequence[Any]], limit: int) -> Optional[str]:
+        return self.encode_cursor(list(key_rows[limit - 1])) if len(key_rows) > limit else None
+
+    def cursor_for(self, row: Any) -> str:
+        return self.encode_cursor([getattr(row, c.key) for c in self.columns])
+
+    def page(self, rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+        """Split the ``limit + 1`` fetched rows into the page and the next cursor."""
+        items = list(rows[:limit])
+        next_cursor = self.cursor_for(items[-1]) if len(rows) > limit else None
+        return items, next_cursor
@@ -0,0 +1,136 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from models import async_crud, crud, schemas
+from models.order import ORDER_NUMBER_TAKEN, Order, OrderStatus
+from models.user import User, UserPermission
+from src.auth.security import permission_required
+from src.database import db_session, get_db
+from src.etag import conditional
+from src.imports.common import check_upload_size
+from src.imports.orders import RollbackPolicy, import_orders
+from src.order_query import OrderQuery, OrderSort
+from src.streaming import raw_columns, stream_csv
+from datetime import date
+from typing import List, Optional
+
+router = APIRouter(prefix="/orders", tags=["orders"])
+
+@router.get("/", response_model=List[schemas.Order])
+async def read_orders(
+    response: Response,
+    status: Optional[OrderStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    sort: OrderSort = OrderSort.CREATED_AT,
+    descending: bool = True,
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("read_orders")),
+    etag: str = Depends(conditional("read_orders", ["orders"]))
+):
+    query = OrderQuery(status.value if status else None, date_from, date_to, sort, descending)
+    orders, next_cursor = await async_crud.run(db, crud.get_orders_page, query, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return orders
+
+@router.get("/board", response_model=List[schemas.BoardColumn])
+async def read_order_board(
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("read_order_board")),
+    etag: str = Depends(conditional("read_order_board", ["orders"]))
+):
+    return await async_crud.run(db, crud.get_order_board, limit)
+
+@router.patch("/{order_id}/status", response_model=schemas.Order)
+async def update_order_status(
+    order_id: int,
+    update: schemas.OrderStatusUpdate,
+    current_user: User = Depends(permission_required(UserPermission.MANAGE_ORDERS)),
+    db: Session = Depends(db_session("update_order_status"))
+):
+    order = await async_crud.run(db, crud.get_order, order_id)
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return await async_crud.run(db, crud.set_order_status, order, update.status.value)
+
+@router.post("/import", response_model=schemas.ImportReport)
+async def import_orders_csv(
+    file: UploadFile = File(...),
+    policy: RollbackPolicy = RollbackPolicy.ROW,
+    current_user: User = Depends(permission_required(UserPermission.IMPORT_EXPORT)),
+    db: Session = Depends(get_db)
+):
+    check_upload_size(file)
+    report = await run_in_threadpool(import_orders, db, file.file, policy)
+    return report.to_dict()
+
+@router.get("/export")
+async def export_orders_csv(
+    current_user: User = Depends(permission_required(UserPermission.IMPORT_EXPORT)),
+    db: Session = Depends(db_session("export_orders"))
+):
+    statement = raw_columns(Order.__table__).order_by(Order.id)
+    return stream_csv(db, statement, f"orders-{date.today():%Y%m%d}.csv")
+
+@router.get("/search", response_model=List[schemas.Order])
+async def search_orders(
+    q: str = Query(..., min_length=3, max_length=100),
+    status: Optional[OrderStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("search_orders")),
+    etag: str = Depends(conditional("search_orders", ["orders"]))
+):
+    return await async_crud.run(
+        db, crud.search_orders, q, status.value if status else None, date_from, date_to, limit
+    )
+
+async def check_order(db, order_number: Optional[str], product_list: Optional[list]):
+    if order_number is not None and await async_crud.run(db, crud.get_order_by_number, order_number):
+        raise HTTPException(status_code=400, detail=ORDER_NUMBER_TAKEN)
+    if product_list is not None:
+        unknown = await async_crud.run(db, crud.get_unknown_products, [p.id for p in product_list])
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown product ids: {', '.join(unknown)}")
+
+@router.post("/", response_model=schemas.Order, status_code=201)
+async def create_order(
+    order: schemas.OrderCreate,
+    current_user: User = Depends(permission_required(UserPermission.MANAGE_ORDERS)),
+    db: Session = Depends(db_session("create_order"))
+):
+    await check_order(db, order.order_number, order.product_list)
+    return await async_crud.run(db, crud.create_order, order)
+
+@router.get("/{order_id}", response_model=schemas.OrderDetail)
+async def read_order(
+    order_id: int,
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("read_order")),
+    etag: str = Depends(conditional("read_order", ["orders", "products"]))
+):
+    detail = await async_crud.run(db, crud.get_order_detail, order_id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return detail
+
+@router.patch("/{order_id}", response_model=schemas.Order)
+async def update_order(
+    order_id: int,
+    update: schemas.OrderUpdate,
+    current_user: User = Depends(permission_required(UserPermission.MANAGE_ORDERS)),
+    db: Session = Depends(db_session("update_order"))
+):
+    order = await async_crud.run(db, crud.get_order, order_id)
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    number = update.order_number if update.order_number not in (None, order.order_number) else None
+    await check_order(db, number, update.product_list)
+    changes = update.model_dump(mode="json", exclude_unset=True)
+    return await async_crud.run(db, crud.update_order, order, changes)
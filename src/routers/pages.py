@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import RedirectResponse
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+from src.auth.security import authenticate_user, create_access_token
+from src.auth.session import SessionData, flash, set_session_data
+from src.database import db_session
+
+router = APIRouter(tags=["pages"])
+
+@router.get("/")
+async def home(request: Request):
+    return request.app.state.templates.TemplateResponse("index.html", {"request": request})
+
+@router.get("/login")
+async def login_page(request: Request):
+    return request.app.state.templates.TemplateResponse("auth/login.html", {"request": request})
+
+@router.post("/login")
+async def login(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(db_session("login"))
+):
+    client_ip = request.client.host
+    auth_logger = request.app.state.auth_logger
+    
+    if auth_logger.is_account_locked(form_data.username):
+        flash(request, "Account temporarily locked due to multiple failed attempts", "error")
+        return RedirectResponse(url="/login", status_code=303)
+    
+    try:
+        user = await authenticate_user(db, form_data.username, form_data.password)
+        if not user:
+            auth_logger.log_failed_attempt(form_data.username, client_ip)
+            flash(request, "Invalid username or password", "error")
+            return RedirectResponse(url="/login", status_code=303)
+        
+        access_token = create_access_token(data={"sub": user.username})
+        session_data = SessionData(user.id, user.username, user.role)
+        set_session_data(request, session_data)
+        
+        flash(request, "Successfully logged in", "success")
+        return RedirectResponse(url="/", status_code=303)
+    except HTTPException:
+        raise
+    except Exception as e:
+        flash(request, "An error occurred during login", "error")
+        return RedirectResponse(url="/login", status_code=303)
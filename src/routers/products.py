@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
+from models import async_crud, crud, schemas
+from models.order import OrderStatus
+from models.product import Product
+from models.user import User, UserPermission
+from src.auth.security import get_current_user, permission_required
+from src.autocomplete import AutocompleteConfig, product_index
+from src.database import db_session, get_db
+from src.etag import conditional
+from src.imports.common import check_upload_size
+from src.imports.products import import_products
+from src.pagination import Keyset
+from src.streaming import StreamConfig, raw_columns, stream_csv
+from datetime import date
+
+router = APIRouter(prefix="/products", tags=["products"])
+
+async def refresh_product_index(db):
+    generation = product_index.generation
+    rows = await async_crud.run(db, crud.get_product_search_rows)
+    await run_in_threadpool(product_index.rebuild, rows, generation)
+
+@router.get("/", response_model=List[schemas.Product])
+async def read_products(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=StreamConfig.MAX_PAGE_ROWS),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(db_session("read_products")),
+    etag: str = Depends(conditional("read_products", ["products"]))
+):
+    keyset = Keyset(Product.internal_id, scope="products")
+    products, next_cursor = await async_crud.run(db, crud.get_products_page, keyset, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return products
+
+@router.post("/import", response_model=schemas.ImportReport)
+async def import_products_csv(
+    file: UploadFile = File(...),
+    current_user: User = Depends(permission_required(UserPermission.IMPORT_EXPORT)),
+    db: Session = Depends(get_db)
+):
+    check_upload_size(file)
+    report = await run_in_threadpool(import_products, db, file.file)
+    if report.imported:
+        await refresh_product_index(db)
+    return report.to_dict()
+
+@router.get("/search", response_model=List[schemas.ProductMatch])
+async def search_products(
+    q: str = Query(..., min_length=AutocompleteConfig.MIN_QUERY_LENGTH, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(db_session("search_products"))
+):
+    if product_index.needs_refresh():
+        await refresh_product_index(db)
+    return product_index.search(q, limit)
+
+@router.get("/export")
+async def export_products_csv(
+    current_user: User = Depends(permission_required(UserPermission.IMPORT_EXPORT)),
+    db: Session = Depends(db_session("export_products"))
+):
+    statement = raw_columns(Product.__table__).order_by(Product.internal_id)
+    return stream_csv(db, statement, f"products-{date.today():%Y%m%d}.csv")
+
+@router.get("/quantities", response_model=List[schemas.ProductOrderTotal])
+async def read_product_quantities(
+    ids: List[str] = Query(..., max_length=StreamConfig.MAX_PAGE_ROWS),
+    status: List[OrderStatus] = Query([]),
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("read_product_quantities")),
+    etag: str = Depends(conditional("read_product_quantities", ["orders"]))
+):
+    rows = await async_crud.run(db, crud.get_product_quantities, ids, [s.value for s in status])
+    return [{"product_id": p, "quantity": quantity, "orders": orders} for p, quantity, orders in rows]
+
+@router.get("/{product_id}/orders", response_model=List[schemas.Order])
+async def read_product_orders(
+    product_id: str,
+    status: List[OrderStatus] = Query([]),
+    limit: int = Query(100, ge=1, le=StreamConfig.MAX_PAGE_ROWS),
+    current_user: User = Depends(permission_required(UserPermission.VIEW_ORDERS)),
+    db: Session = Depends(db_session("read_product_orders")),
+    etag: str = Depends(conditional("read_product_orders", ["orders"]))
+):
+    return await async_crud.run(db, crud.get_product_orders, product_id, [s.value for s in status], limit)
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Request
+from models.user import User, UserPermission
+from src.auth.hashing import password_hasher
+from src.auth.logging import logging_stats
+from src.auth.security import permission_required, token_cache, user_cache
+from src.autocomplete import product_index
+from src.database import get_async_engine, get_engine, pool_stats
+from src.templating import template_stats
+
+router = APIRouter(tags=["system"])
+
+@router.get("/health")
+async def health_check():
+    """Simple health check endpoint"""
+    return {"status": "healthy"}
+
+@router.get("/metrics")
+async def metrics(
+    request: Request,
+    current_user: User = Depends(permission_required(UserPermission.MANAGE_USERS))
+):
+    """Internal counters for capacity planning; admins only"""
+    state = request.app.state
+    stats = {
+        "hashing": password_hasher.stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "sessions": state.session_store.stats(),
+        "product_index": product_index.stats(),
+        "templates": template_stats(state.templates),
+        "logging": logging_stats(),
+        "db_pool": pool_stats(get_engine())
+    }
+    # Only reported once an async route has built the engine.
+    if get_async_engine.created:
+        stats["async_db_pool"] = pool_stats(get_async_engine().sync_engine)
+    return stats
@@ -0,0 +1,237 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.security import OAuth2PasswordRequestForm
+from datetime import datetime, timedelta
+from typing import Optional, List
+from functools import wraps
+import inspect
+from enum import Enum
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from models.user import User
+from models import crud, async_crud, schemas
+from src.database import db_session
+from src.auth.security import (
+    get_current_user, 
+    SecurityUtils,
+    authenticate_user,
+    create_access_token,
+    invalidate_cached_user
+)
+from src.pagination import Keyset
+from src.streaming import StreamConfig, StreamFormat, stream_query
+
+router = APIRouter(tags=["users"])
+
+@router.post("/token")
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(db_session("token"))
+):
+    user = await authenticate_user(db, form_data.username, form_data.password)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    access_token = create_access_token(data={"sub": user.username})
+    return {"access_token": access_token, "token_type": "bearer"}
+
+@router.get("/users/me")
+async def read_users_me(current_user = Depends(get_current_user)):
+    return current_user
+
+@router.get("/profile", response_model=schemas.UserProfile)
+async def get_profile(current_user: User = Depends(get_current_user)):
+    return current_user
+
+@router.put("/profile/password")
+async def change_password(
+    password_data: schemas.PasswordChange,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(db_session("change_password"))
+):
+    if not await current_user.verify_password_async(password_data.current_password):
+        raise HTTPException(status_code=400, detail="Invalid current password")
+        
+    hashed_password = await User.get_password_hash_async(password_data.new_password)
+    await async_crud.run(db, crud.set_password, current_user.id, hashed_password)
+    invalidate_cached_user(current_user.username)
+    return {"message": "Password updated successfully"}
+
+class Role(str, Enum):
+    ADMIN = "admin"
+    MANAGER = "manager"
+    USER = "user"
+
+def check_role(allowed_roles: list[Role]):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, current_user: User = Depends(get_current_user), **kwargs):
+            if current_user.role not in allowed_roles:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Operation not permitted"
+                )
+            return await func(*args, **kwargs)
+        # FastAPI reads the wrapped handler's signature; add current_user to it
+        # so the dependency is actually resolved.
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(
+                "current_user",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Depends(get_current_user),
+                annotation=User
+            )
+        ])
+        return wrapper
+    return decorator
+
+class UserSort(str, Enum):
+    ID = "id"
+    USERNAME = "username"
+    EMAIL = "email"
+
+USER_SORT_COLUMNS = {
+    UserSort.ID: (User.id,),
+    UserSort.USERNAME: (User.username, User.id),
+    UserSort.EMAIL: (User.email, User.id),
+}
+
+@router.post("/users/", response_model=schemas.User)
+@check_role([Role.ADMIN])
+async def create_user(user: schemas.UserCreate, db: Session = Depends(db_session("create_user"))):
+    db_user = await async_crud.run(db, crud.get_user_by_email, email=user.email)
+    if db_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    hashed_password = await User.get_password_hash_async(user.password)
+    return await async_crud.run(db, crud.create_user, user=user, hashed_password=hashed_password)
+
+@router.get("/users/", response_model=List[schemas.User])
+@check_role([Role.ADMIN])
+async def read_users(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=StreamConfig.MAX_ROWS),
+    sort: UserSort = UserSort.ID,
+    descending: bool = False,
+    stream: Optional[StreamFormat] = None,
+    skip: int = Query(0, ge=0, deprecated=True, description="Removed; page with cursor instead"),
+    db: Session = Depends(db_session("read_users"))
+):
+    if skip:
+        raise HTTPException(
+            status_code=400,
+            detail="skip is no longer supported; pass the X-Next-Cursor header of the previous page as cursor"
+        )
+    keyset = Keyset(*USER_SORT_COLUMNS[sort], descending=descending, scope=f"users:{sort.value}")
+    if stream:
+        next_cursor = await async_crud.run(db, crud.get_users_next_cursor, keyset, cursor, limit)
+        return stream_query(
+            db,
+            keyset.apply(select(User), cursor, limit, lookahead=False),
+            schemas.User,
+            stream,
+            headers={"X-Next-Cursor": next_cursor} if next_cursor else None
+        )
+
+    if limit > StreamConfig.MAX_PAGE_ROWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"limit above {StreamConfig.MAX_PAGE_ROWS} requires stream=json or stream=ndjson"
+        )
+    users, next_cursor = await async_crud.run(db, crud.get_users_page, keyset, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return users
+
+@router.get("/users/{user_id}", response_model=schemas.User)
+@check_role([Role.ADMIN])
+async def read_user(user_id: int, db: Session = Depends(db_session("read_user"))):
+    db_user = await async_crud.run(db, crud.get_user, user_id=user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
+
+@router.put("/users/{user_id}", response_model=schemas.User)
+@check_role([Role.ADMIN])
+async def update_user(
+    user_id: int,
+    user_update: schemas.UserCreate,
+    db: Session = Depends(db_session("update_user"))
+):
+    db_user = await async_crud.run(db, crud.get_user, user_id=user_id)
+    if not db_user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    previous_username = db_user.username
+    changes = {}
+    for field, value in user_update.dict().items():
+        if field == "password":
+            changes["hashed_password"] = await User.get_password_hash_async(value)
+        else:
+            changes[field] = value
+            
+    db_user = await async_crud.run(db, crud.update_user, db_user, changes)
+    invalidate_cached_user(previous_username, db_user.username)
+    return db_user
+
+@router.post("/password-reset-request")
+async def request_password_reset(
+    request_data: schemas.PasswordResetRequest,
+    db: Session = Depends(db_session("request_password_reset"))
+):
+    user = await async_crud.run(db, crud.get_user_by_email, request_data.email)
+    if user:
+        reset_token = SecurityUtils.generate_reset_token()
+        expires = datetime.utcnow() + timedelta(hours=24)
+        await async_crud.run(db, crud.set_reset_token, user.id, reset_token, expires)
+        
+        # Here you would typically send an email with the reset token
+        # For development, we'll just return it
+        return {"message": "Reset token generated", "token": reset_token}
+    raise HTTPException(status_code=404, detail="User not found")
+
+@router.post("/password-reset")
+async def reset_password(
+    reset_data: schemas.PasswordReset,
+    db: Session = Depends(db_session("reset_password"))
+):
+    if reset_data.new_password != reset_data.confirm_password:
+        raise HTTPException(status_code=400, detail="Passwords do not match")
+        
+    if not SecurityUtils.validate_password_strength(reset_data.new_password):
+        raise HTTPException(
+            status_code=400, 
+            detail="Password must be at least 8 characters and contain uppercase, lowercase, and numbers"
+        )
+        
+    user = await async_crud.run(db, crud.get_user_by_reset_token, reset_data.token)
+    if not user or user.reset_token_expires < datetime.utcnow():
+        raise HTTPException(status_code=400, detail="Invalid or expired reset token")
+        
+    hashed_password = await SecurityUtils.get_password_hash_async(reset_data.new_password)
+    await async_crud.run(db, crud.reset_password, user.id, hashed_password)
+    invalidate_cached_user(user.username)
+    
+    return {"message": "Password successfully reset"}
+
+@router.get("/protected")
+async def protected_endpoint(current_user: User = Depends(get_current_user)):
+    """Protected endpoint requiring authentication"""
+    return {"message": "This is a protected endpoint"}
+
+@router.post("/users/", status_code=status.HTTP_201_CREATED, response_model=schemas.User)
+async def create_user(user: schemas.UserCreate, db: Session = Depends(db_session("create_user"))):
+    try:
+        db_user = await async_crud.run(db, crud.get_user_by_email, email=user.email)
+        if db_user:
+            raise HTTPException(status_code=400, detail="Email already registered")
+        hashed_password = await User.get_password_hash_async(user.password)
+        return await async_crud.run(db, crud.create_user, user=user, hashed_password=hashed_password)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
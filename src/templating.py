@@ -0,0 +1,74 @@
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, nodes
+from jinja2.ext import Extension
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from src.cache import TTLCache
+import os
+
+class TemplateConfig:
+    # Shared by every worker on the host. Unset, Jinja picks a private
+    # per-user directory under the system temp dir.
+    BYTECODE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR")
+    FRAGMENT_CACHE_SIZE = int(os.getenv("TEMPLATE_FRAGMENT_CACHE_SIZE", "256"))
+    FRAGMENT_CACHE_TTL = int(os.getenv("TEMPLATE_FRAGMENT_CACHE_TTL", "3600"))
+
+class FragmentCacheExtension(Extension):
+    """``{% cache "key", ... %}...{% endcache %}`` keeps a rendered block in memory.
+
+    The cache key is the template name, the template file's mtime when it
+    was compiled, the tag's line and the arguments. Editing the template
+    recompiles it with a new mtime, so its old fragments are simply never
+    hit again; the arguments carry whatever part of the context the block
+    depends on (``{% cache "nav", current_user.role %}``).
+    """
+    tags = {"cache"}
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=TTLCache(
+            TemplateConfig.FRAGMENT_CACHE_SIZE, TemplateConfig.FRAGMENT_CACHE_TTL
+        ))
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        mtime = os.stat(parser.filename).st_mtime_ns if parser.filename else 0
+        prefix = nodes.Const((parser.name, mtime, lineno))
+        return nodes.CallBlock(
+            self.call_method("_render", [prefix, nodes.Tuple(args, "load")]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render(self, prefix: tuple, args: tuple, caller: Callable[[], str]) -> str:
+        key = prefix + args
+        cache = self.environment.fragment_cache
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = caller()
+            cache.set(key, fragment)
+        return fragment
+
+def create_templates(directory: Path, cache_dir: Optional[str] = TemplateConfig.BYTECODE_CACHE_DIR) -> Jinja2Templates:
+    """Jinja2Templates whose compiled templates persist in a bytecode cache."""
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(str(directory)),
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        extensions=[FragmentCacheExtension]
+    )
+    return Jinja2Templates(env=env)
+
+def precompile_templates(templates: Jinja2Templates) -> int:
+    """Compile every template at boot; the first worker fills the bytecode cache."""
+    names = templates.env.list_templates(filter_func=lambda name: not os.path.basename(name).startswith("."))
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+def template_stats(templates: Jinja2Templates) -> Dict[str, Any]:
+    return {"fragments": templates.env.fragment_cache.stats()}
@@ -1,10 +1,13 @@
 import pytest
+from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
+from jose import jwt
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from src.main import app
 from src.database import get_db
-from src.auth.security import create_test_token, SecurityUtils
+from src.auth.security import create_test_token, SecurityConfig, SecurityUtils, user_cache
+from src.autocomplete import product_index
 from models import Base
 from models.user import User, UserRole
 
@@ -40,10 +43,32 @@ def client(db):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
+    user_cache.clear()
+    product_index.clear()
+    # The app's rate limiter lives for the whole session; each test starts fresh.
+    app.state.rate_limiter.reset("testclient")
+    with TestClient(app, base_url="http://localhost") as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+class FakeClock:
+    """A ``timer=`` stand-in that only moves when a test sets ``now``."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(request):
+    """A FakeClock at 0.0, or at the start given by indirect parametrization:
+    ``@pytest.mark.parametrize("clock", [1000.0], indirect=True)``. A callable
+    start (``time.time``) is read when the test runs.
+    """
+    start = getattr(request, "param", 0.0)
+    return FakeClock(start() if callable(start) else start)
+
 @pytest.fixture
 def test_token():
     return create_test_token(UserRole.USER)
@@ -92,4 +117,13 @@ def admin_user(db):
     db.refresh(db_user)
     return db_user
 
+@pytest.fixture
+def admin_headers(admin_user):
+    token = jwt.encode(
+        {"sub": admin_user.username, "exp": datetime.utcnow() + timedelta(minutes=5)},
+        SecurityConfig.SECRET_KEY,
+        algorithm=SecurityConfig.ALGORITHM
+    )
+    return {"Authorization": f"Bearer {token}"}
+
 # Remove duplicate test_health_check and login route
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+from fastapi.testclient import TestClient
+from src.database import get_async_engine
+from src.main import AppSettings, create_app
+
+def test_import_builds_nothing():
+    code = (
+        "import sys, src.main, src.database as db; "
+        "assert src.main._app is None; "
+        "assert not db.get_engine.created and not db.get_async_engine.created; "
+        "assert 'src.routers.orders' not in sys.modules and 'jinja2' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+def test_module_app_is_built_once(client):
+    import src.main
+    assert src.main.app is src.main.app is client.app
+
+def test_factory_apps_are_independent(tmp_path):
+    (tmp_path / "index.html").write_text("custom {{ static_url('css/site.css') }}")
+    app = create_app(AppSettings(title="Other", templates_dir=tmp_path, requests_per_minute=1))
+    assert app.title == "Other"
+    with TestClient(app, base_url="http://localhost") as client:
+        response = client.get("/")
+        assert response.text == "custom /static/css/site.css"
+        assert client.get("/").status_code == 429
+
+def test_metrics_do_not_build_the_async_engine(client, admin_headers):
+    created = get_async_engine.created
+    stats = client.get("/metrics", headers=admin_headers).json()
+    assert ("async_db_pool" in stats) == created
+    assert get_async_engine.created == created
@@ -0,0 +1,74 @@
+import gzip
+import json
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+from src.assets import AssetManifest, PrecompressedStaticFiles, accepted_encodings, build_assets
+
+CSS = b"body { color: #333; }\n" * 100
+
+def make_build(tmp_path):
+    source = tmp_path / "static"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "site.css").write_bytes(CSS)
+    (source / "logo.png").write_bytes(b"\x89PNG" * 200)
+    (source / "tiny.js").write_bytes(b"x=1")
+    (source / ".gitkeep").write_bytes(b"")
+    target = tmp_path / "build"
+    return build_assets(source, target), target
+
+def make_client(directory, manifest):
+    app = Starlette(routes=[Mount("/static", PrecompressedStaticFiles(directory=directory, manifest=manifest))])
+    return TestClient(app)
+
+def test_build_fingerprints_and_compresses(tmp_path):
+    manifest, target = make_build(tmp_path)
+    assert sorted(manifest) == ["css/site.css", "logo.png", "tiny.js"]
+    css = manifest["css/site.css"]
+    assert css.startswith("css/site.") and css.endswith(".css")
+    assert gzip.decompress((target / f"{css}.gz").read_bytes()) == CSS
+    assert not (target / f"{manifest['logo.png']}.gz").exists()
+    assert not (target / f"{manifest['tiny.js']}.gz").exists()
+    assert json.loads((target / "manifest.json").read_text()) == manifest
+
+    (tmp_path / "static" / "css" / "site.css").write_bytes(CSS + b"a { }")
+    assert build_assets(tmp_path / "static", target)["css/site.css"] != css
+
+def test_manifest_urls(tmp_path):
+    _, target = make_build(tmp_path)
+    assets = AssetManifest.load(target)
+    assert assets.url("/css/site.css") == f"/static/{assets.entries['css/site.css']}"
+    assert assets.url("missing.js") == "/static/missing.js"
+    assert AssetManifest.load(tmp_path / "nowhere").url("css/site.css") == "/static/css/site.css"
+
+def test_serves_precompressed_variant(tmp_path):
+    _, target = make_build(tmp_path)
+    assets = AssetManifest.load(target)
+    client = make_client(target, assets)
+    url = assets.url("css/site.css")
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == CSS
+
+    plain = client.get(url, headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in plain.headers
+    assert int(plain.headers["content-length"]) == len(CSS)
+    assert plain.headers["etag"] != response.headers["etag"]
+
+    again = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    assert again.status_code == 304
+
+def test_unbuilt_files_are_revalidated(tmp_path):
+    make_build(tmp_path)
+    client = make_client(tmp_path / "static", AssetManifest())
+    response = client.get("/static/css/site.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, br;q=0.5, identity;q=0") == {"gzip": 1.0, "br": 0.5, "identity": 0.0}
+    assert accepted_encodings("") == {}
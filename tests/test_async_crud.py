@@ -0,0 +1,58 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from models import Base, async_crud, crud, schemas
+from models.user import UserRole
+from src.database import DatabaseConfig, db_session, get_async_db, get_db
+
+@pytest.fixture
+async def async_db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+def new_user(username="asyncuser"):
+    return schemas.UserCreate(
+        username=username,
+        email=f"{username}@example.com",
+        password="Test123!",
+        role=UserRole.USER
+    )
+
+async def test_async_twins_match_sync_crud(async_db):
+    user = await async_crud.run(async_db, crud.create_user, user=new_user(), hashed_password="hash")
+    assert (await async_crud.run(async_db, crud.get_user, user_id=user.id)).username == "asyncuser"
+    assert (await async_crud.run(async_db, crud.get_user_by_email, "asyncuser@example.com")).id == user.id
+    assert [u.id for u in await async_crud.run(async_db, crud.get_users)] == [user.id]
+
+    await async_crud.run(async_db, crud.set_password, user.id, "new-hash")
+    await async_db.refresh(user)
+    assert user.hashed_password == "new-hash"
+
+async def test_sync_session_runs_in_threadpool(db):
+    user = await async_crud.run(db, crud.create_user, user=new_user("syncuser"), hashed_password="hash")
+    updated = await async_crud.run(db, crud.update_user, user, {"email": "changed@example.com"})
+    assert updated.email == "changed@example.com"
+    assert (await async_crud.run(db, crud.get_user_by_username, "syncuser")).id == user.id
+
+async def test_only_crud_functions_are_dispatched(async_db):
+    assert set(async_crud.TWINS) >= {crud.create_user, crud.get_user}
+    with pytest.raises(TypeError):
+        await async_crud.run(async_db, len, [])
+
+def test_db_session_switch(monkeypatch):
+    monkeypatch.setattr(DatabaseConfig, "ASYNC_ROUTES", frozenset({"read_user"}))
+    assert db_session("read_user") is get_async_db
+    assert db_session("read_users") is get_db
+
+async def test_async_duplicate_order_number_is_a_400(async_db):
+    order = schemas.OrderCreate(order_number="O1", customer_name="Globex", project_name="Web",
+                                product_list=[{"id": "P1", "quantity": 1}])
+    await async_crud.run(async_db, crud.create_order, order)
+    with pytest.raises(HTTPException) as raised:
+        await async_crud.run(async_db, crud.create_order, order)
+    assert raised.value.status_code == 400
+    assert await async_crud.run(async_db, crud.get_order_by_number, "O1") is not None
@@ -0,0 +1,66 @@
+from models.product import Product
+from src.autocomplete import ProductIndex, product_index
+
+ROWS = [
+    (1, "ABC-100", "Steel bracket"),
+    (2, "XYZ-200", "Bracket abc edition"),
+    (3, "QRS-300", "Copper pipe"),
+    (4, "ABCD-400", "Aluminium bracket"),
+]
+
+def ids(results):
+    return [r["id"] for r in results]
+
+def test_search_matches_id_and_name_substrings():
+    index = ProductIndex()
+    index.rebuild(ROWS)
+    assert ids(index.search("abc")) == ["ABCD-400", "ABC-100", "XYZ-200"]
+    assert ids(index.search("PIPE")) == ["QRS-300"]
+    assert ids(index.search("racket", limit=2)) == ["ABCD-400", "XYZ-200"]
+    assert index.search("ab") == []
+
+def test_refined_query_reuses_cached_matches():
+    index = ProductIndex()
+    index.rebuild(ROWS)
+    index.search("abc")
+    index._state.postings = {}
+    assert ids(index.search("abcd")) == ["ABCD-400"]
+    assert index.refinements == 1
+
+def test_changes_clear_cached_results():
+    index = ProductIndex()
+    index.rebuild(ROWS)
+    index.search("abc")
+    index.apply({5: ("ABC-500", "Brass hinge"), 1: None})
+    assert ids(index.search("abc")) == ["ABCD-400", "ABC-500", "XYZ-200"]
+
+def test_rebuild_during_updates_stays_stale():
+    index = ProductIndex()
+    generation = index.generation
+    index.apply({9: ("NEW-1", "Late product")})
+    index.rebuild(ROWS, generation)
+    assert index.needs_refresh()
+
+def test_committed_orm_changes_update_index(db):
+    product_index.rebuild([])
+    product = Product(id="HNG-1", product_name="Brass hinge")
+    db.add(product)
+    db.commit()
+    assert ids(product_index.search("hinge")) == ["HNG-1"]
+
+    product.product_name = "Brass latch"
+    db.commit()
+    assert product_index.search("hinge") == []
+    assert ids(product_index.search("latch")) == ["HNG-1"]
+
+    db.delete(product)
+    db.flush()
+    db.rollback()
+    assert ids(product_index.search("latch")) == ["HNG-1"]
+
+def test_search_endpoint_sees_imported_products(client, admin_headers):
+    files = {"file": ("products.csv", b"id,product_name\nP1,Widget\nP2,Gadget\n", "text/csv")}
+    client.post("/products/import", files=files, headers=admin_headers)
+    response = client.get("/products/search", params={"q": "adge"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert [p["id"] for p in response.json()] == ["P2"]
@@ -0,0 +1,53 @@
+import threading
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from models import Base
+from models.user import User
+from src.database import DatabaseConfig, create_db_engine, pool_stats
+
+@pytest.fixture
+def production_engine(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'app.db'}", profile="production")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+def test_profile_pragmas_are_applied(production_engine):
+    with production_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+def test_env_overrides_pool_size(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    assert DatabaseConfig.engine_settings("production")["pool_size"] == 3
+    with pytest.raises(ValueError):
+        DatabaseConfig.engine_settings("nonexistent")
+
+def test_concurrent_writers_do_not_hit_locked_database(production_engine):
+    Session = sessionmaker(bind=production_engine)
+    workers, rows_per_worker = 8, 25
+    errors = []
+
+    def write(worker):
+        try:
+            for i in range(rows_per_worker):
+                with Session() as db:
+                    db.add(User(username=f"w{worker}-{i}", email=f"w{worker}-{i}@example.com", role="user"))
+                    db.commit()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with Session() as db:
+        assert db.query(User).count() == workers * rows_per_worker
+    stats = pool_stats(production_engine)
+    assert stats["checkouts"] >= workers * rows_per_worker
+    assert stats["in_use"] == 0
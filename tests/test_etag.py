@@ -0,0 +1,66 @@
+from models import crud
+from models.order import Order
+from models.product import Product
+from src.etag import etag_matches
+
+def add_order(db, number):
+    db.add(Order(order_number=number, customer_name="Globex", project_name="Web", product_list=[]))
+    db.commit()
+
+def test_etag_matching_is_weak():
+    assert etag_matches('W/"abc"', 'W/"abc"')
+    assert etag_matches('"abc"', 'W/"abc"')
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches("*", 'W/"abc"')
+    assert not etag_matches('W/"abd"', 'W/"abc"')
+
+def test_versions_bump_with_committed_writes_only(db):
+    assert crud.get_table_versions(db, ["orders", "products"]) == {}
+    add_order(db, "O1")
+    db.execute(Order.__table__.insert(), [
+        {"order_number": f"B{i}", "customer_name": "Initech", "project_name": "TPS", "product_list": []} for i in range(2)
+    ])
+    db.commit()
+    assert crud.get_table_versions(db, ["orders", "products"]) == {"orders": 3}
+
+    db.query(Order).filter_by(order_number="O1").one().status = "completed"
+    db.flush()
+    db.rollback()
+    assert crud.get_table_versions(db, ["orders"]) == {"orders": 3}
+
+    db.add(Product(id="P1", product_name="Widget"))
+    db.commit()
+    assert crud.get_table_versions(db, ["orders", "products"]) == {"orders": 3, "products": 1}
+
+def test_conditional_get(client, admin_headers, db):
+    add_order(db, "O1")
+    response = client.get("/orders/", headers=admin_headers)
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get("/orders/", headers={**admin_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    other = client.get("/orders/", params={"sort": "project_name"}, headers={**admin_headers, "If-None-Match": etag})
+    assert other.status_code == 200
+
+    add_order(db, "O2")
+    changed = client.get("/orders/", headers={**admin_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()) == 2
+
+def test_detail_tracks_products(client, admin_headers, db):
+    add_order(db, "O1")
+    order_id = db.query(Order).one().id
+    etag = client.get(f"/orders/{order_id}", headers=admin_headers).headers["etag"]
+    db.add(Product(id="P1", product_name="Widget"))
+    db.commit()
+    response = client.get(f"/orders/{order_id}", headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+
+def test_not_modified_requires_authentication(client, db):
+    response = client.get("/orders/", headers={"If-None-Match": "*"})
+    assert response.status_code == 401
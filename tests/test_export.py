@@ -0,0 +1,39 @@
+import csv
+import io
+import json
+from models.order import Order
+from models.product import Product
+from src.streaming import CSVEncoder
+
+def read_csv(response):
+    assert response.content.startswith(b"\xef\xbb\xbf")
+    return list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+
+def test_csv_encoder_writes_header_once():
+    encoder = CSVEncoder(["id", "name"])
+    chunks = [encoder.encode([(1, "a")]), encoder.encode([(2, 'with "quotes", commas')]), encoder.finish()]
+    text = b"".join(chunks).decode("utf-8-sig")
+    assert list(csv.reader(io.StringIO(text))) == [["id", "name"], ["1", "a"], ["2", 'with "quotes", commas']]
+    assert CSVEncoder(["id"]).finish() == "\ufeffid\r\n".encode()
+
+def test_export_products_streams_every_row(client, admin_headers, db):
+    db.execute(Product.__table__.insert(), [
+        {"id": f"P{i:03d}", "product_name": f"Product {i}"} for i in range(1200)
+    ])
+    db.commit()
+    response = client.get("/products/export", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith('attachment; filename="products-')
+    rows = read_csv(response)
+    assert rows[0] == ["internal_id", "id", "product_name", "created_at", "updated_at"]
+    assert len(rows) == 1201
+    assert rows[1][1:3] == ["P000", "Product 0"]
+
+def test_export_orders_keeps_product_list_json(client, admin_headers, db):
+    db.add(Order(order_number="O1", customer_name="ACME", project_name="Web",
+                 product_list=[{"id": "P1", "quantity": 2}], status="new"))
+    db.commit()
+    rows = read_csv(client.get("/orders/export", headers=admin_headers))
+    header, row = rows
+    assert json.loads(row[header.index("product_list")]) == [{"id": "P1", "quantity": 2}]
+    assert row[header.index("notes")] == ""
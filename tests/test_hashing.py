@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from src.auth.hashing import PasswordHasher, pwd_context
+
+class BlockingContext:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def verify(self, plain_password, hashed_password):
+        self.release.wait(5)
+        return True
+
+    def hash(self, password):
+        return password
+
+async def test_hash_and_verify_roundtrip():
+    hasher = PasswordHasher(pwd_context, pool_size=1, max_queue=1)
+    hashed = await hasher.hash("Test123!")
+    assert await hasher.verify("Test123!", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats()["completed"] == 3
+    hasher.shutdown()
+
+async def test_full_queue_is_rejected_with_503():
+    context = BlockingContext()
+    hasher = PasswordHasher(context, pool_size=1, max_queue=1)
+    running = asyncio.ensure_future(hasher.verify("a", "b"))
+    waiting = asyncio.ensure_future(hasher.verify("a", "b"))
+    await asyncio.sleep(0)
+    assert hasher.stats()["queue_depth"] == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.verify("a", "b")
+    assert exc_info.value.status_code == 503
+    assert hasher.stats()["rejected"] == 1
+
+    context.release.set()
+    assert await running and await waiting
+    assert hasher.stats()["in_flight"] == 0
+    hasher.shutdown()
+
+def test_metrics_expose_hashing_counters(client, admin_headers):
+    response = client.get("/metrics", headers=admin_headers)
+    assert response.status_code == 200
+    assert "queue_depth" in response.json()["hashing"]
+
+def test_metrics_require_admin(client, test_user, test_token):
+    assert client.get("/metrics").status_code == 401
+    headers = {"Authorization": f"Bearer {test_token}"}
+    assert client.get("/metrics", headers=headers).status_code == 403
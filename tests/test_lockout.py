@@ -0,0 +1,46 @@
+from datetime import timedelta
+from src.auth.lockout import LockoutTracker
+from src.auth.logging import AuthLogger
+
+def make_tracker(clock, **kwargs):
+    return LockoutTracker(max_attempts=3, lockout_duration=timedelta(minutes=15), timer=clock, **kwargs)
+
+def test_locks_after_max_attempts_within_window(clock):
+    tracker = make_tracker(clock)
+    for _ in range(2):
+        tracker.record_failure("alice")
+    assert not tracker.is_locked("alice")
+    tracker.record_failure("alice")
+    assert tracker.is_locked("alice")
+    clock.now = 15 * 60
+    assert not tracker.is_locked("alice")
+
+def test_keeps_only_last_attempts_per_user(clock):
+    tracker = make_tracker(clock)
+    for i in range(100):
+        clock.now = i
+        tracker.record_failure("alice")
+    assert list(tracker.attempts["alice"]) == [97, 98, 99]
+
+def test_tracked_users_are_capped(clock):
+    tracker = make_tracker(clock, max_keys=50)
+    for i in range(1000):
+        tracker.record_failure(f"user{i}")
+    assert len(tracker) == 50
+    assert tracker.evictions == 950
+    assert "user999" in tracker.attempts
+
+def test_stale_users_expire(clock):
+    tracker = make_tracker(clock, expire_batch=100)
+    for i in range(20):
+        tracker.record_failure(f"user{i}")
+    clock.now = 16 * 60
+    tracker.record_failure("fresh")
+    assert list(tracker.attempts) == ["fresh"]
+
+def test_auth_logger_uses_bounded_tracker_by_default():
+    logger = AuthLogger()
+    for _ in range(logger.max_attempts):
+        logger.log_failed_attempt("bob", "10.0.0.1")
+    assert logger.is_account_locked("bob")
+    assert isinstance(logger.lockouts, LockoutTracker)
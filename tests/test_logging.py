@@ -0,0 +1,36 @@
+import json
+import logging
+from src.auth.logging import BatchRotatingFileHandler, LogPipeline
+
+def make_record(message, level=logging.WARNING):
+    return logging.LogRecord("auth", level, __file__, 0, message, None, None)
+
+def test_pipeline_writes_json_lines(tmp_path):
+    path = tmp_path / "auth.log"
+    pipeline = LogPipeline(BatchRotatingFileHandler(str(path)), flush_interval=0.05)
+    pipeline.start()
+    pipeline.enqueue(make_record({"event": "failed_login", "username": "alice"}))
+    pipeline.enqueue(make_record("plain message"))
+    pipeline.stop()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["event"] == "failed_login"
+    assert lines[0]["level"] == "WARNING"
+    assert lines[1]["message"] == "plain message"
+    assert pipeline.stats()["written"] == 2
+
+def test_full_queue_drops_and_counts(tmp_path):
+    pipeline = LogPipeline(BatchRotatingFileHandler(str(tmp_path / "auth.log")), queue_size=2)
+    for i in range(5):
+        pipeline.enqueue(make_record(f"attempt {i}"))
+    assert pipeline.stats()["queue_depth"] == 2
+    assert pipeline.stats()["dropped"] == 3
+
+def test_batches_rotate_files(tmp_path):
+    path = tmp_path / "auth.log"
+    handler = BatchRotatingFileHandler(str(path), max_bytes=500, backup_count=2)
+    for i in range(5):
+        handler.emit_batch([make_record(f"attempt {i}") for _ in range(2)])
+    handler.close()
+    assert (tmp_path / "auth.log.1").exists()
+    assert path.stat().st_size <= 500
@@ -0,0 +1,42 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+from src.middleware import SecurityMiddleware
+
+def make_app(requests_per_minute=60):
+    app = FastAPI()
+    app.add_middleware(SecurityMiddleware, requests_per_minute=requests_per_minute)
+    app.add_middleware(SessionMiddleware, secret_key="test")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/login")
+    async def login(request: Request):
+        request.session["session"] = {"username": "alice", "last_activity": "2000-01-01T00:00:00"}
+        return {}
+
+    @app.get("/session")
+    async def session(request: Request):
+        return request.session["session"]
+
+    return app
+
+def test_security_headers_are_added(client):
+    response = client.get("/health")
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+
+def test_rate_limit_short_circuits_with_headers():
+    client = TestClient(make_app(requests_per_minute=2))
+    assert client.get("/health").status_code == 200
+    assert client.get("/health").status_code == 200
+    response = client.get("/health")
+    assert response.status_code == 429
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+def test_session_activity_is_touched():
+    client = TestClient(make_app())
+    client.get("/login")
+    assert client.get("/session").json()["last_activity"] > "2000-01-01T00:00:00"
@@ -0,0 +1,67 @@
+from datetime import datetime
+from sqlalchemy import select
+from models import crud
+from models.order import Order, OrderStatusCount, rebuild_status_counts
+
+def add_orders(db, statuses):
+    for i, status in enumerate(statuses):
+        db.add(Order(order_number=f"O{i}", customer_name="Globex", project_name="Website", product_list=[],
+                     status=status, created_at=datetime(2024, 1, 1 + i)))
+    db.commit()
+
+def counts(db):
+    return dict(db.execute(select(OrderStatusCount.status, OrderStatusCount.count)).all())
+
+def test_counters_follow_inserts_transitions_and_deletes(db):
+    add_orders(db, ["new", "new", "in_progress"])
+    db.execute(Order.__table__.insert(), [
+        {"order_number": "B1", "customer_name": "Initech", "project_name": "TPS", "product_list": [], "status": "completed"}
+    ])
+    db.commit()
+    assert counts(db) == {"new": 2, "in_progress": 1, "completed": 1}
+
+    order = db.query(Order).filter_by(order_number="O0").one()
+    crud.set_order_status(db, order, "in_progress")
+    order.notes = "no status change"
+    db.commit()
+    assert counts(db) == {"new": 1, "in_progress": 2, "completed": 1}
+
+    db.delete(order)
+    db.commit()
+    assert counts(db) == {"new": 1, "in_progress": 1, "completed": 1}
+
+def test_counters_roll_back_with_the_transition(db):
+    add_orders(db, ["new"])
+    db.query(Order).one().status = "cancelled"
+    db.flush()
+    assert counts(db) == {"new": 0, "cancelled": 1}
+    db.rollback()
+    assert counts(db) == {"new": 1}
+
+def test_rebuild_matches_triggers(db):
+    add_orders(db, ["new", "completed", "completed"])
+    expected = counts(db)
+    db.execute(OrderStatusCount.__table__.delete())
+    rebuild_status_counts(db.connection())
+    assert counts(db) == expected
+
+def test_board_returns_newest_cards_and_totals_per_column(db):
+    add_orders(db, ["new", "new", "new", "completed"])
+    board = crud.get_order_board(db, limit=2)
+    assert [c["status"] for c in board] == ["new", "in_progress", "completed", "cancelled"]
+    assert [(c["count"], [o.order_number for o in c["orders"]]) for c in board] == [
+        (3, ["O2", "O1"]), (0, []), (1, ["O3"]), (0, [])
+    ]
+
+def test_board_and_status_endpoints(client, admin_headers, db):
+    add_orders(db, ["new"])
+    order_id = db.query(Order).one().id
+    response = client.patch(f"/orders/{order_id}/status", json={"status": "completed"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert client.patch("/orders/999/status", json={"status": "new"}, headers=admin_headers).status_code == 404
+    assert client.patch(f"/orders/{order_id}/status", json={"status": "shipped"}, headers=admin_headers).status_code == 422
+
+    board = client.get("/orders/board", headers=admin_headers).json()
+    assert {c["status"]: c["count"] for c in board} == {"new": 0, "in_progress": 0, "completed": 1, "cancelled": 0}
+    assert board[2]["orders"][0]["order_number"] == "O0"
@@ -0,0 +1,86 @@
+import io
+import pytest
+from models.order import Order
+from models.product import Product
+from src.imports.orders import RollbackPolicy, ValidationPool, import_orders, validate_row
+
+HEADER = "order_number,customer_name,project_name,product_list,status,notes\n"
+
+def order_line(number, products='[{""id"": ""P1"", ""quantity"": 2}]', status="new", notes=""):
+    return f'{number},ACME,Website,"{products}",{status},{notes}\n'
+
+def csv_bytes(*lines):
+    return io.BytesIO((HEADER + "".join(lines)).encode())
+
+@pytest.fixture
+def products(db):
+    db.add_all([Product(id="P1", product_name="First"), Product(id="P2", product_name="Second")])
+    db.commit()
+
+def test_validate_row_normalises_product_list():
+    values, error = validate_row({
+        "order_number": "O1", "customer_name": "ACME", "project_name": "Web",
+        "product_list": '["P1", {"id": 2, "quantity": 3}]', "status": "new"
+    })
+    assert error is None
+    assert values["product_list"] == [{"id": "P1", "quantity": 1}, {"id": "2", "quantity": 3}]
+
+@pytest.mark.parametrize("row_change, message", [
+    ({"status": "shipped"}, "Invalid status"),
+    ({"product_list": "not json"}, "Invalid product_list"),
+    ({"product_list": "[]"}, "Invalid product_list"),
+    ({"product_list": '[{"id": "P1", "quantity": 0}]'}, "Invalid product_list"),
+    ({"customer_name": ""}, "customer_name is required"),
+])
+def test_validate_row_errors(row_change, message):
+    row = {
+        "order_number": "O1", "customer_name": "ACME", "project_name": "Web",
+        "product_list": '["P1"]', "status": "new", **row_change
+    }
+    assert validate_row(row)[1].startswith(message)
+
+def test_row_policy_skips_invalid_rows(db, products):
+    source = csv_bytes(
+        order_line("O1"),
+        order_line("O1"),
+        order_line("O2", products='[""P9""]'),
+        order_line("O3", status="bogus"),
+        order_line("O4"),
+    )
+    report = import_orders(db, source, pool=None).to_dict()
+    assert report["imported"] == 2
+    assert [e["line"] for e in report["errors"]] == [3, 4, 5]
+    assert "Unknown product ids: P9" in report["errors"][1]["error"]
+    assert set(report["stages"]) == {"read", "validate", "resolve", "write"}
+    order = db.query(Order).filter_by(order_number="O4").one()
+    assert order.product_list == [{"id": "P1", "quantity": 2}]
+
+def test_chunk_policy_drops_failing_chunks(db, products):
+    source = csv_bytes(order_line("O1"), order_line("O2"), order_line("O3", status="x"), order_line("O4"))
+    report = import_orders(db, source, RollbackPolicy.CHUNK, chunk_size=2, pool=None)
+    assert report.imported == 2
+    assert report.rolled_back == 1
+    assert sorted(o.order_number for o in db.query(Order)) == ["O1", "O2"]
+
+def test_all_policy_imports_nothing_on_error(db, products):
+    source = csv_bytes(order_line("O1"), order_line("O2"), order_line("O3", status="x"))
+    report = import_orders(db, source, RollbackPolicy.ALL, chunk_size=1, pool=None)
+    assert report.imported == 0
+    assert report.rolled_back == 2
+    assert db.query(Order).count() == 0
+
+def test_parallel_validation_keeps_input_order(db, products):
+    pool = ValidationPool(workers=2)
+    try:
+        lines = [order_line(f"O{i}", status="x" if i % 7 == 0 else "new") for i in range(50)]
+        report = import_orders(db, csv_bytes(*lines), chunk_size=4, pool=pool)
+    finally:
+        pool.shutdown()
+    assert report.imported == 42
+    assert [e["line"] for e in report.errors] == [i + 2 for i in range(50) if i % 7 == 0]
+
+def test_order_import_endpoint(client, admin_headers, db, products):
+    files = {"file": ("orders.csv", (HEADER + order_line("O1")).encode(), "text/csv")}
+    response = client.post("/orders/import?policy=all", files=files, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
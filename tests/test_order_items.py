@@ -0,0 +1,100 @@
+import io
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from models import async_crud, crud, schemas
+from models.order import ORDER_NUMBER_TAKEN, Order, OrderItem, rebuild_order_items
+from models.product import Product
+from src.imports.orders import import_orders
+
+def add_products(db, *ids):
+    for product_id in ids:
+        db.add(Product(id=product_id, product_name=f"Product {product_id}"))
+    db.commit()
+
+def items(db):
+    return db.execute(
+        select(OrderItem.order_id, OrderItem.product_id, OrderItem.quantity).order_by(OrderItem.order_id, OrderItem.line)
+    ).all()
+
+def test_items_follow_create_edit_and_delete(db):
+    order = Order(order_number="O1", customer_name="Globex", project_name="Web",
+                  product_list=[{"id": "P1", "quantity": 2}, {"id": "P2", "quantity": 1}])
+    db.add(order)
+    db.commit()
+    assert items(db) == [(order.id, "P1", 2), (order.id, "P2", 1)]
+
+    order.product_list = [{"id": "P3", "quantity": 4}]
+    db.commit()
+    assert items(db) == [(order.id, "P3", 4)]
+
+    db.delete(order)
+    db.commit()
+    assert items(db) == []
+
+def test_items_follow_bulk_import(db):
+    add_products(db, "P1", "P2")
+    source = io.BytesIO(
+        b'order_number,customer_name,project_name,product_list,status\n'
+        b'O1,Globex,Web,"[{""id"": ""P1"", ""quantity"": 2}]",new\n'
+        b'O2,Initech,TPS,"[{""id"": ""P1"", ""quantity"": 3}, {""id"": ""P2"", ""quantity"": 1}]",completed\n'
+    )
+    assert import_orders(db, source, pool=None).imported == 2
+    assert [(p, q) for _, p, q in items(db)] == [("P1", 2), ("P1", 3), ("P2", 1)]
+    assert crud.get_product_quantities(db, ["P1", "P2"], []) == [("P1", 5, 2), ("P2", 1, 1)]
+    assert crud.get_product_quantities(db, ["P1"], ["new"]) == [("P1", 2, 1)]
+    assert [o.order_number for o in crud.get_product_orders(db, "P1", ["new", "in_progress"])] == ["O1"]
+
+def test_rebuild_matches_triggers(db):
+    db.add(Order(order_number="O1", customer_name="Globex", project_name="Web",
+                 product_list=[{"id": "P1", "quantity": 2}, {"id": "P1", "quantity": 1}]))
+    db.commit()
+    expected = items(db)
+    db.execute(OrderItem.__table__.delete())
+    rebuild_order_items(db.connection())
+    assert items(db) == expected
+
+def test_order_endpoints(client, admin_headers, db):
+    add_products(db, "P1", "P2")
+    payload = {"order_number": "O1", "customer_name": "Globex", "project_name": "Web",
+               "product_list": [{"id": "P1", "quantity": 2}]}
+    response = client.post("/orders/", json=payload, headers=admin_headers)
+    assert response.status_code == 201
+    order_id = response.json()["id"]
+    assert client.post("/orders/", json=payload, headers=admin_headers).status_code == 400
+    unknown = dict(payload, order_number="O2", product_list=[{"id": "P9", "quantity": 1}])
+    assert client.post("/orders/", json=unknown, headers=admin_headers).json()["message"] == "Unknown product ids: P9"
+
+    changes = {"product_list": [{"id": "P2", "quantity": 5}, {"id": "P9", "quantity": 1}]}
+    assert client.patch(f"/orders/{order_id}", json=changes, headers=admin_headers).status_code == 400
+    changes = {"product_list": [{"id": "P2", "quantity": 5}, {"id": "P1", "quantity": 1}], "notes": "rush"}
+    assert client.patch(f"/orders/{order_id}", json=changes, headers=admin_headers).json()["notes"] == "rush"
+
+    detail = client.get(f"/orders/{order_id}", headers=admin_headers).json()
+    assert detail["order"]["order_number"] == "O1"
+    assert detail["items"] == [
+        {"product_id": "P2", "product_name": "Product P2", "quantity": 5},
+        {"product_id": "P1", "product_name": "Product P1", "quantity": 1}
+    ]
+    assert client.get("/orders/999", headers=admin_headers).status_code == 404
+
+    orders = client.get("/products/P2/orders", params={"status": ["new"]}, headers=admin_headers).json()
+    assert [o["order_number"] for o in orders] == ["O1"]
+    totals = client.get("/products/quantities", params={"ids": ["P1", "P2"]}, headers=admin_headers).json()
+    assert totals == [{"product_id": "P1", "quantity": 1, "orders": 1}, {"product_id": "P2", "quantity": 5, "orders": 1}]
+
+async def test_order_number_race_is_a_400(db):
+    # Both requests passed check_order; the unique constraint stops the second.
+    order = schemas.OrderCreate(order_number="O1", customer_name="Globex", project_name="Web",
+                                product_list=[{"id": "P1", "quantity": 1}])
+    created = crud.create_order(db, order)
+    with pytest.raises(HTTPException) as raised:
+        await async_crud.run(db, crud.create_order, order)
+    assert (raised.value.status_code, raised.value.detail) == (400, ORDER_NUMBER_TAKEN)
+
+    other = crud.create_order(db, order.model_copy(update={"order_number": "O2"}))
+    with pytest.raises(HTTPException) as raised:
+        await async_crud.run(db, crud.update_order, other, {"order_number": "O1"})
+    assert raised.value.status_code == 400
+    assert [o.order_number for o in db.execute(select(Order).order_by(Order.id)).scalars()] == ["O1", "O2"]
+    assert created.order_number == "O1"
@@ -0,0 +1,89 @@
+import itertools
+import pytest
+from datetime import date, datetime
+from sqlalchemy import create_engine, event
+from models import Base, crud
+from models.order import Order
+from src.order_query import OrderQuery, OrderSort
+
+COMBINATIONS = list(itertools.product(
+    [None, "new"],
+    [(None, None), (date(2024, 1, 1), date(2024, 3, 31))],
+    list(OrderSort),
+    [False, True],
+    [False, True]
+))
+
+@pytest.fixture(scope="module")
+def explain():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    enabled = []
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def add_explain(conn, cursor, statement, parameters, context, executemany):
+        return ("EXPLAIN QUERY PLAN " + statement if enabled else statement), parameters
+
+    with engine.connect() as connection:
+        def plan(statement):
+            enabled.append(True)
+            try:
+                return [row[3] for row in connection.execute(statement)]
+            finally:
+                enabled.clear()
+        yield plan
+
+@pytest.mark.parametrize("status, dates, sort, descending, paged", COMBINATIONS)
+def test_every_combination_reads_its_index_in_order(explain, status, dates, sort, descending, paged):
+    query = OrderQuery(status, *dates, sort=sort, descending=descending)
+    cursor = None
+    if paged:
+        key = datetime(2024, 2, 1) if sort is OrderSort.CREATED_AT else "M"
+        cursor = query.keyset.encode_cursor([key, 100])
+    plan = explain(query.page(cursor, 25))
+    assert len(plan) == 1, plan
+    assert "TEMP B-TREE" not in plan[0]
+    assert plan[0].startswith(("SEARCH", "SCAN")) and f"USING INDEX {query.index}" in plan[0], plan
+
+def test_pages_follow_sort_and_filters(db):
+    for i in range(30):
+        db.add(Order(order_number=f"O{i:02d}", customer_name=f"Customer {i % 4}", project_name=f"P{i % 5}",
+                     product_list=[], status="new" if i % 2 else "completed",
+                     created_at=datetime(2024, 1 + i % 6, 1 + i)))
+    db.commit()
+    query = OrderQuery("new", date(2024, 2, 1), date(2024, 5, 31), OrderSort.PROJECT_NAME, descending=True)
+    seen, cursor = [], None
+    while True:
+        orders, cursor = crud.get_orders_page(db, query, cursor, limit=4)
+        seen += orders
+        if not cursor:
+            break
+    expected = sorted(
+        (o for o in db.query(Order) if o.status == "new" and datetime(2024, 2, 1) <= o.created_at < datetime(2024, 6, 1)),
+        key=lambda o: (o.project_name, o.id), reverse=True
+    )
+    assert [o.id for o in seen] == [o.id for o in expected]
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_created_at_pages_share_timestamps(db, descending):
+    # Three orders per timestamp, so ties straddle the two-row page boundaries.
+    for i in range(7):
+        db.add(Order(order_number=f"O{i}", customer_name="ACME", project_name="Web", product_list=[],
+                     status="new", created_at=datetime(2024, 1, 1, 10, i // 3)))
+    db.commit()
+    query = OrderQuery(sort=OrderSort.CREATED_AT, descending=descending)
+    seen, cursor = [], None
+    for _ in range(10):
+        orders, cursor = crud.get_orders_page(db, query, cursor, limit=2)
+        seen += [o.id for o in orders]
+        if not cursor:
+            break
+    expected = sorted((o.created_at, o.id) for o in db.query(Order))
+    assert seen == [i for _, i in (expected[::-1] if descending else expected)]
+
+def test_orders_endpoint(client, admin_headers, db):
+    db.add(Order(order_number="O1", customer_name="ACME", project_name="Web", product_list=[], status="new"))
+    db.commit()
+    response = client.get("/orders/", params={"sort": "customer_name", "status": "new"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert [o["order_number"] for o in response.json()] == ["O1"]
@@ -0,0 +1,53 @@
+from datetime import date, datetime
+from models import crud
+from models.order import Order
+
+def add_order(db, number, customer="Globex", project="Website", notes=None, status="new", created_at=None):
+    order = Order(order_number=number, customer_name=customer, project_name=project, notes=notes,
+                  status=status, product_list=[{"id": "P1", "quantity": 1}], created_at=created_at)
+    db.add(order)
+    db.commit()
+    return order
+
+def numbers(orders):
+    return [o.order_number for o in orders]
+
+def test_substring_search_is_case_insensitive(db):
+    add_order(db, "O1", customer="ACME Corporation")
+    add_order(db, "O2", notes="ship to acme warehouse")
+    add_order(db, "O3")
+    assert sorted(numbers(crud.search_orders(db, "cme"))) == ["O1", "O2"]
+
+def test_bulk_inserts_edits_and_deletes_are_indexed(db):
+    db.execute(Order.__table__.insert(), [
+        {"order_number": "B1", "customer_name": "Initech", "project_name": "TPS", "product_list": [], "status": "new"}
+    ])
+    db.commit()
+    assert numbers(crud.search_orders(db, "initech")) == ["B1"]
+
+    order = db.query(Order).filter_by(order_number="B1").one()
+    order.customer_name = "Umbrella"
+    db.commit()
+    assert crud.search_orders(db, "initech") == []
+    assert numbers(crud.search_orders(db, "umbrella")) == ["B1"]
+
+    db.delete(order)
+    db.commit()
+    assert crud.search_orders(db, "umbrella") == []
+
+def test_filters_and_ranking(db):
+    add_order(db, "O1", customer="Acme", project="Acme portal", created_at=datetime(2024, 1, 10))
+    add_order(db, "O2", notes="for acme", status="completed", created_at=datetime(2024, 2, 1))
+    add_order(db, "O3", customer="Acme", created_at=datetime(2024, 3, 1))
+    assert numbers(crud.search_orders(db, "acme"))[0] == "O1"
+    assert numbers(crud.search_orders(db, "acme", status="completed")) == ["O2"]
+    found = crud.search_orders(db, "acme", date_from=date(2024, 1, 10), date_to=date(2024, 2, 1))
+    assert sorted(numbers(found)) == ["O1", "O2"]
+
+def test_search_endpoint(client, admin_headers, db):
+    add_order(db, "O1", customer="Acme")
+    response = client.get("/orders/search", params={"q": "acm"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert [o["order_number"] for o in response.json()] == ["O1"]
+    response = client.get("/orders/search", params={"q": "ac"}, headers=admin_headers)
+    assert response.status_code == 422
@@ -0,0 +1,85 @@
+from datetime import datetime
+import os
+import subprocess
+import sys
+import pytest
+from sqlalchemy import select
+from models.user import User
+from src.auth.security import SecurityConfig
+from src.pagination import Keyset, PaginationConfig
+
+@pytest.fixture
+def many_users(db):
+    for i in range(7):
+        db.add(User(username=f"user{i}", email=f"user{i}@example.com", role="user", hashed_password="x"))
+    db.commit()
+
+def fetch_all(client, headers, **params):
+    seen, cursor = [], None
+    while True:
+        query = dict(params, limit=3)
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/users/", headers=headers, params=query)
+        assert response.status_code == 200
+        seen.extend(user["username"] for user in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return seen
+
+def test_pages_cover_every_user_once(client, admin_headers, many_users):
+    usernames = fetch_all(client, admin_headers, sort="username")
+    assert usernames == sorted(usernames)
+    assert len(usernames) == len(set(usernames)) == 8
+
+def test_descending_order(client, admin_headers, many_users):
+    usernames = fetch_all(client, admin_headers, sort="email", descending=True)
+    assert usernames[0] == "user6"
+    assert usernames[-1] == "admin"
+
+def test_tampered_or_foreign_cursor_is_rejected(client, admin_headers, many_users):
+    response = client.get("/users/", headers=admin_headers, params={"limit": 3, "sort": "username"})
+    cursor = response.headers["x-next-cursor"]
+    for params in [{"cursor": cursor[:-2] + "AA"}, {"cursor": cursor, "sort": "email"}]:
+        assert client.get("/users/", headers=admin_headers, params=params).status_code == 400
+
+def test_offset_paging_is_rejected(client, admin_headers, many_users):
+    response = client.get("/users/", headers=admin_headers, params={"skip": 3})
+    assert response.status_code == 400
+    assert "cursor" in response.json()["message"]
+    assert client.get("/users/", headers=admin_headers, params={"skip": 0}).status_code == 200
+
+def test_keyset_does_not_use_offset():
+    keyset = Keyset(User.username, User.id, scope="users:username")
+    cursor = keyset.encode_cursor(["user3", 4])
+    sql = str(keyset.apply(select(User), cursor, 10).compile())
+    assert "OFFSET" not in sql.upper()
+    assert keyset.decode_cursor(cursor) == ["user3", 4]
+
+def test_cursor_round_trips_datetimes():
+    keyset = Keyset(User.id, scope="test")
+    moment = datetime(2024, 5, 1, 12, 30)
+    assert keyset.decode_cursor(keyset.encode_cursor([moment])) == [moment]
+
+ISSUE_CURSOR = (
+    "from models.user import User\n"
+    "from src.pagination import Keyset\n"
+    "print(Keyset(User.id, scope='users:id').encode_cursor([42]))"
+)
+
+def issue_cursor_in_another_process(**env) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", ISSUE_CURSOR],
+        env={**os.environ, **env}, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+def test_cursor_is_accepted_by_another_worker(monkeypatch):
+    monkeypatch.setattr(SecurityConfig, "SECRET_KEY", "shared-secret")
+    monkeypatch.setattr(PaginationConfig, "CURSOR_SECRET", None)
+    cursor = issue_cursor_in_another_process(SECRET_KEY="shared-secret")
+    assert Keyset(User.id, scope="users:id").decode_cursor(cursor) == [42]
+
+    monkeypatch.setattr(PaginationConfig, "CURSOR_SECRET", "cursor-secret")
+    cursor = issue_cursor_in_another_process(CURSOR_SECRET="cursor-secret")
+    assert Keyset(User.id, scope="users:id").decode_cursor(cursor) == [42]
@@ -0,0 +1,52 @@
+import io
+import pytest
+from fastapi import HTTPException
+from models.product import Product
+from src.imports.common import ImportConfig
+from src.imports.products import import_products
+
+def csv_bytes(text, bom=False):
+    return io.BytesIO(("\ufeff" if bom else "").encode() + text.encode())
+
+def test_import_reports_invalid_rows(db):
+    source = csv_bytes(
+        "id,product_name\n"
+        "P1,First\n"
+        "P2,\n"
+        "P1,Duplicate\n"
+        f"P3,{'x' * 501}\n"
+        ",Nameless\n"
+        "P4,Fourth\n",
+        bom=True
+    )
+    report = import_products(db, source, batch_size=1).to_dict()
+    assert report["processed"] == 6
+    assert report["imported"] == 2
+    assert [e["line"] for e in report["errors"]] == [3, 4, 5, 6]
+    assert sorted(p.id for p in db.query(Product)) == ["P1", "P4"]
+
+def test_import_rejects_ids_already_stored(db):
+    import_products(db, csv_bytes("id,product_name\nP1,First\n"))
+    report = import_products(db, csv_bytes("id,product_name\nP1,Again\nP2,Second\n"))
+    assert report.imported == 1
+    assert report.errors == [{"line": 2, "error": "Duplicate product id: P1"}]
+    assert db.query(Product).count() == 2
+
+def test_missing_columns_are_rejected(db):
+    with pytest.raises(HTTPException) as exc:
+        import_products(db, csv_bytes("id,name\nP1,First\n"))
+    assert exc.value.status_code == 400
+
+def test_import_endpoint(client, admin_headers):
+    files = {"file": ("products.csv", b"id,product_name\nP1,First\n", "text/csv")}
+    response = client.post("/products/import", files=files, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
+    response = client.get("/products/", headers=admin_headers)
+    assert [p["id"] for p in response.json()] == ["P1"]
+
+def test_import_endpoint_enforces_size_cap(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(ImportConfig, "MAX_UPLOAD_BYTES", 10)
+    files = {"file": ("products.csv", b"id,product_name\nP1,First\n", "text/csv")}
+    response = client.post("/products/import", files=files, headers=admin_headers)
+    assert response.status_code == 413
@@ -0,0 +1,47 @@
+import pytest
+from fastapi import HTTPException
+from src.auth.rate_limit import RateLimiter, SlidingWindowCounter
+from src.auth.state import MemoryStateBackend
+
+def test_rejects_requests_over_the_limit(clock):
+    limiter = RateLimiter(requests_per_minute=3, backend=MemoryStateBackend(timer=clock))
+    for _ in range(3):
+        assert limiter.check_rate_limit("1.2.3.4")
+    with pytest.raises(HTTPException) as exc_info:
+        limiter.check_rate_limit("1.2.3.4")
+    assert exc_info.value.status_code == 429
+    assert limiter.allow("5.6.7.8")
+
+def test_window_slides_instead_of_resetting(clock):
+    counter = SlidingWindowCounter(window=60, timer=clock)
+    for _ in range(10):
+        assert counter.hit("client", limit=10)
+    # Halfway through the next window half of the previous hits still count.
+    clock.now = 90
+    assert counter.count("client") == pytest.approx(5)
+    for _ in range(5):
+        assert counter.hit("client", limit=10)
+    assert not counter.hit("client", limit=10)
+
+def test_idle_clients_are_swept(clock):
+    counter = SlidingWindowCounter(window=60, sweep_batch=4, timer=clock)
+    for i in range(4):
+        counter.hit(f"10.0.0.{i}", limit=10)
+    clock.now = 200
+    counter.hit("10.0.0.99", limit=10)
+    assert list(counter.clients) == ["10.0.0.99"]
+
+def test_rejected_hits_are_not_counted(clock):
+    counter = SlidingWindowCounter(window=60, timer=clock)
+    counter.hit("client", limit=1)
+    for _ in range(5):
+        assert not counter.hit("client", limit=1)
+    assert counter.count("client") == 1
+
+def test_reset_clears_one_client(clock):
+    limiter = RateLimiter(requests_per_minute=1, backend=MemoryStateBackend(timer=clock))
+    assert limiter.allow("1.2.3.4") and limiter.allow("5.6.7.8")
+    assert not limiter.allow("1.2.3.4")
+    limiter.reset("1.2.3.4")
+    assert limiter.allow("1.2.3.4")
+    assert not limiter.allow("5.6.7.8")
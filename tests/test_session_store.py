@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from src.auth.session import SessionConfig, SessionStore, touch
+from src.middleware import SecurityMiddleware
+
+def make_app(store):
+    app = FastAPI()
+    app.add_middleware(SecurityMiddleware, session_store=store)
+
+    @app.get("/login")
+    async def login(request: Request):
+        request.session["session"] = {
+            "username": "alice",
+            "last_activity": datetime.utcnow().isoformat()
+        }
+        return {}
+
+    @app.get("/visit")
+    async def visit(request: Request):
+        request.session["visits"] = request.session.get("visits", 0) + 1
+        return {}
+
+    @app.get("/session")
+    async def session(request: Request):
+        return request.session.get("session")
+
+    @app.get("/logout")
+    async def logout(request: Request):
+        request.session.clear()
+        return {}
+
+    return app
+
+@pytest.mark.parametrize("clock", [1000.0], indirect=True)
+def test_store_round_trip_and_expiry(clock, tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"), timer=clock)
+    session_id = store.create(store.dumps({"a": 1}))
+    store.cache.clear()
+    assert store.loads(store.load(session_id)) == {"a": 1}
+    clock.now += SessionConfig.SESSION_TIMEOUT.total_seconds() + 1
+    assert store.load(session_id) is None
+    store.close()
+
+def test_cookie_is_sent_only_when_session_is_created(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    client = TestClient(make_app(store), base_url="https://testserver")
+    response = client.get("/login")
+    assert "set-cookie" in response.headers
+    writes = store.writes
+
+    response = client.get("/session")
+    assert response.json()["username"] == "alice"
+    assert "set-cookie" not in response.headers
+    assert store.writes == writes
+
+def test_logout_deletes_session_and_cookie(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    client = TestClient(make_app(store), base_url="https://testserver")
+    client.get("/login")
+    session_id = client.cookies[SessionConfig.COOKIE_NAME]
+    response = client.get("/logout")
+    assert "max-age=0" in response.headers["set-cookie"]
+    assert store.load(session_id) is None
+
+def test_login_rotates_the_session_id(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    client = TestClient(make_app(store), base_url="https://testserver")
+    client.get("/visit")
+    anonymous_id = client.cookies[SessionConfig.COOKIE_NAME]
+    response = client.get("/login")
+    assert "set-cookie" in response.headers
+    assert client.cookies[SessionConfig.COOKIE_NAME] != anonymous_id
+    assert store.load(anonymous_id) is None
+    assert client.get("/session").json()["username"] == "alice"
+
+@pytest.mark.parametrize("clock", [1000.0], indirect=True)
+def test_logout_reaches_other_workers(clock, tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a = SessionStore(path, timer=clock)
+    worker_b = SessionStore(path, timer=clock)
+    before = worker_a.dumps({"a": 1})
+    session_id = worker_a.create(before)
+    assert worker_b.load(session_id) == before
+
+    worker_a.delete(session_id)
+    assert not worker_b.save(session_id, worker_b.dumps({"a": 2}), before)
+    assert worker_a.load(session_id) is None
+    clock.now += SessionConfig.CACHE_TTL
+    assert worker_b.load(session_id) is None
+
+def test_stale_snapshot_does_not_overwrite(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    worker_a = SessionStore(path)
+    worker_b = SessionStore(path)
+    first = worker_a.dumps({"a": 1})
+    session_id = worker_a.create(first)
+    worker_b.load(session_id)
+    assert worker_a.save(session_id, worker_a.dumps({"a": 2}), first)
+    assert not worker_b.save(session_id, worker_b.dumps({"a": 3}), first)
+    assert worker_b.loads(worker_b.load(session_id)) == {"a": 2}
+
+def test_touch_is_throttled():
+    now = datetime.utcnow()
+    session = {"session": {"last_activity": now.isoformat()}}
+    assert not touch(session, now + SessionConfig.REFRESH_TIMEOUT / 2)
+    later = now + SessionConfig.REFRESH_TIMEOUT + timedelta(seconds=1)
+    assert touch(session, later)
+    assert session["session"]["last_activity"] == later.isoformat()
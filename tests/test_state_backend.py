@@ -0,0 +1,47 @@
+import threading
+import pytest
+from src.auth.logging import AuthLogger
+from src.auth.state import MemoryStateBackend, SQLiteStateBackend
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "state.db")
+
+@pytest.mark.parametrize("clock", [1_000_000.0], indirect=True)
+def test_sqlite_hit_checks_and_increments_in_one_step(state_path, clock):
+    backend = SQLiteStateBackend(state_path, timer=clock)
+    assert [backend.hit("ip", limit=3, window=60) for _ in range(5)] == [True, True, True, False, False]
+    assert backend.count("ip", window=60) == 3
+    backend.reset("ip", window=60)
+    assert backend.count("ip", window=60) == 0
+
+def test_sqlite_matches_memory_backend_across_windows(clock, state_path):
+    memory = MemoryStateBackend(timer=clock)
+    sqlite = SQLiteStateBackend(state_path, timer=clock)
+    for now in [0, 1, 2, 30, 59, 61, 75, 90, 119, 130, 200, 201]:
+        clock.now = now
+        assert memory.hit("ip", 3, 60) == sqlite.hit("ip", 3, 60)
+        assert memory.count("ip", 60) == pytest.approx(sqlite.count("ip", 60))
+
+def test_workers_share_one_limit(state_path):
+    workers = [SQLiteStateBackend(state_path) for _ in range(4)]
+    allowed = []
+
+    def run(backend):
+        for _ in range(25):
+            allowed.append(backend.hit("shared", limit=30, window=3600))
+
+    threads = [threading.Thread(target=run, args=(backend,)) for backend in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 30
+
+def test_lockout_is_shared_between_auth_loggers(state_path):
+    first = AuthLogger(state=SQLiteStateBackend(state_path))
+    second = AuthLogger(state=SQLiteStateBackend(state_path))
+    for _ in range(first.max_attempts):
+        first.log_failed_attempt("victim", "10.0.0.1")
+    assert second.is_account_locked("victim")
+    assert not second.is_account_locked("someone-else")
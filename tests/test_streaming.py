@@ -0,0 +1,47 @@
+import json
+import pytest
+from models import schemas
+from models.user import User
+from src.streaming import RowEncoder, StreamFormat
+
+@pytest.fixture
+def many_users(db):
+    for i in range(12):
+        db.add(User(username=f"user{i:02d}", email=f"user{i:02d}@example.com", role="user", hashed_password="x"))
+    db.commit()
+
+def test_stream_json_array_matches_regular_response(client, admin_headers, many_users):
+    params = {"limit": 5, "sort": "username"}
+    regular = client.get("/users/", headers=admin_headers, params=params)
+    streamed = client.get("/users/", headers=admin_headers, params=dict(params, stream="json"))
+    assert streamed.status_code == 200
+    assert streamed.json() == regular.json()
+    assert streamed.headers["x-next-cursor"] == regular.headers["x-next-cursor"]
+
+def test_stream_ndjson_pages_through_everything(client, admin_headers, many_users):
+    usernames, cursor = [], None
+    while True:
+        params = {"limit": 5, "sort": "username", "stream": "ndjson"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/users/", headers=admin_headers, params=params)
+        assert response.headers["content-type"] == "application/x-ndjson"
+        usernames += [json.loads(line)["username"] for line in response.text.splitlines()]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert usernames == sorted(usernames)
+    assert len(usernames) == 13
+
+def test_encoder_output_is_valid_json_for_any_batch_count():
+    encoder = RowEncoder(schemas.User, StreamFormat.JSON)
+    assert json.loads(encoder.finish()) == []
+
+    encoder = RowEncoder(schemas.User, StreamFormat.JSON)
+    users = [User(id=i, username=f"u{i}", email=f"u{i}@example.com", role="user", is_active=True) for i in range(3)]
+    body = encoder.encode(users[:2]) + encoder.encode(users[2:]) + encoder.finish()
+    assert [user["id"] for user in json.loads(body)] == [0, 1, 2]
+
+def test_large_pages_require_streaming(client, admin_headers):
+    assert client.get("/users/", headers=admin_headers, params={"limit": 2000}).status_code == 400
+    assert client.get("/users/", headers=admin_headers, params={"limit": 2000, "stream": "json"}).status_code == 200
@@ -0,0 +1,51 @@
+import os
+from src.templating import create_templates, precompile_templates
+
+COUNTER = {"calls": 0}
+
+def expensive():
+    COUNTER["calls"] += 1
+    return COUNTER["calls"]
+
+def make_templates(tmp_path, source):
+    directory = tmp_path / "templates"
+    directory.mkdir(exist_ok=True)
+    (directory / "page.html").write_text(source)
+    templates = create_templates(directory, str(tmp_path / "bytecode"))
+    templates.env.globals["expensive"] = expensive
+    return templates
+
+def render(templates, **context):
+    return templates.env.get_template("page.html").render(**context)
+
+def test_precompile_fills_bytecode_cache(tmp_path):
+    templates = make_templates(tmp_path, "<p>{{ name }}</p>")
+    (tmp_path / "templates" / "auth").mkdir()
+    (tmp_path / "templates" / "auth" / "login.html").write_text("{% extends 'page.html' %}")
+    assert precompile_templates(templates) == 2
+    assert len(os.listdir(tmp_path / "bytecode")) == 2
+
+    fresh = create_templates(tmp_path / "templates", str(tmp_path / "bytecode"))
+    assert fresh.env.get_template("page.html").render(name="<b>") == "<p>&lt;b&gt;</p>"
+
+def test_fragment_is_cached_per_key(tmp_path):
+    templates = make_templates(tmp_path, '{% cache "nav", role %}{{ expensive() }}{% endcache %}|{{ expensive() }}')
+    start = COUNTER["calls"]
+    first = render(templates, role="admin")
+    second = render(templates, role="admin")
+    assert first.split("|")[0] == second.split("|")[0] == str(start + 1)
+    assert render(templates, role="user").split("|")[0] != first.split("|")[0]
+
+def test_fragment_invalidates_when_template_changes(tmp_path):
+    templates = make_templates(tmp_path, '{% cache "nav" %}old {{ expensive() }}{% endcache %}')
+    assert render(templates).startswith("old")
+    path = tmp_path / "templates" / "page.html"
+    path.write_text('{% cache "nav" %}new {{ expensive() }}{% endcache %}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert render(templates).startswith("new")
+
+def test_fragment_keeps_autoescaped_markup(tmp_path):
+    templates = make_templates(tmp_path, '{% cache "x" %}{{ value }}{% endcache %}')
+    assert render(templates, value="<i>") == "&lt;i&gt;"
+    assert render(templates, value="<b>") == "&lt;i&gt;"
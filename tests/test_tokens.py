@@ -0,0 +1,64 @@
+import pytest
+import time
+from jose import jwt, JWTError
+from jose.exceptions import ExpiredSignatureError
+from src.auth.tokens import TokenCache
+
+KEY = "test-key"
+# Token expiry is checked against the wall clock, so the fake one starts there.
+wall_clock = pytest.mark.parametrize("clock", [time.time], indirect=True)
+
+def make_token(exp, key=KEY):
+    return jwt.encode({"sub": "alice", "exp": exp}, key, algorithm="HS256")
+
+@wall_clock
+def test_verified_claims_are_cached(clock, monkeypatch):
+    tokens = TokenCache(timer=clock)
+    token = make_token(int(clock.now) + 60)
+    assert tokens.decode(token, KEY, "HS256")["sub"] == "alice"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("decoded twice")
+
+    monkeypatch.setattr(jwt, "decode", fail)
+    assert tokens.decode(token, KEY, "HS256")["sub"] == "alice"
+    assert tokens.cache.hits == 1
+
+@wall_clock
+def test_entries_expire_with_token(clock):
+    tokens = TokenCache(timer=clock)
+    token = make_token(int(clock.now) + 60)
+    tokens.decode(token, KEY, "HS256")
+    clock.now += 61
+    with pytest.raises(ExpiredSignatureError):
+        tokens.decode(token, KEY, "HS256")
+
+@wall_clock
+def test_expired_and_malformed_tokens_rejected_before_verification(clock, monkeypatch):
+    tokens = TokenCache(timer=clock)
+    monkeypatch.setattr(jwt, "decode", lambda *a, **k: pytest.fail("verified"))
+    with pytest.raises(ExpiredSignatureError):
+        tokens.decode(make_token(int(clock.now) - 1), KEY, "HS256")
+    for bad in ("not-a-token", "a.b.c", "a.!!!.c", "x" * 5000):
+        with pytest.raises(JWTError):
+            tokens.decode(bad, KEY, "HS256")
+    assert tokens.rejected == 5
+
+@wall_clock
+def test_bad_signature_is_not_cached(clock):
+    tokens = TokenCache(timer=clock)
+    token = make_token(int(clock.now) + 60, key="other-key")
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            tokens.decode(token, KEY, "HS256")
+    assert len(tokens.cache) == 0
+
+def test_token_endpoint_issues_usable_token(client, test_user):
+    response = client.post("/token", data={
+        "username": test_user["username"],
+        "password": test_user["password"]
+    })
+    token = response.json()["access_token"]
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json()["username"] == test_user["username"]
@@ -0,0 +1,38 @@
+from src.cache import TTLCache
+from src.auth.security import user_cache, invalidate_cached_user
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=10, ttl=5, timer=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+def test_repeated_requests_hit_user_cache(client, test_user, test_token):
+    headers = {"Authorization": f"Bearer {test_token}"}
+    before = user_cache.stats()
+    for _ in range(3):
+        assert client.get("/protected", headers=headers).status_code == 200
+    after = user_cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
+
+def test_invalidation_forces_reload(client, test_user, test_token):
+    headers = {"Authorization": f"Bearer {test_token}"}
+    misses = user_cache.misses
+    client.get("/protected", headers=headers)
+    invalidate_cached_user("testuser")
+    client.get("/protected", headers=headers)
+    assert user_cache.misses - misses == 2